@@ -132,7 +132,9 @@ def generate_pdf(title, ingredients, steps, output_path):
 
 # Main automation pipeline
 def process_images(count):
-    image_files = sorted([f for f in os.listdir(IMAGE_DIR) if f.lower().endswith(('.jpg', '.jpeg', '.png'))])
+    with os.scandir(IMAGE_DIR) as it:
+        image_files = sorted(e.name for e in it if e.is_file()
+                             and e.name.lower().endswith(('.jpg', '.jpeg', '.png')))
     selected_files = image_files[:count]
 
     for img_file in selected_files:
@@ -182,7 +184,9 @@ def process_images(count):
 
 # Run script interactively
 if __name__ == '__main__':
-    image_files = sorted([f for f in os.listdir(IMAGE_DIR) if f.lower().endswith(('.jpg', '.jpeg', '.png'))])
+    with os.scandir(IMAGE_DIR) as it:
+        image_files = sorted(e.name for e in it if e.is_file()
+                             and e.name.lower().endswith(('.jpg', '.jpeg', '.png')))
     print(f"📷 Found {len(image_files)} images.")
     count = input(f"How many recipe images to process? (1–{len(image_files)}): ")
     try:
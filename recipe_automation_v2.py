@@ -6,34 +6,26 @@ import shutil
 import random
 import string
 import logging
-import textwrap
-import hashlib
 import csv
 import argparse
 import sys
-from datetime import datetime
-import pytz
-from openai import OpenAI
-import pytesseract
-from PIL import Image, ImageDraw, ImageFont
-from dotenv import load_dotenv
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-import requests
-from io import BytesIO
 import base64
-from usda_nutrition import USDANutritionAnalyzer
+import hashlib
+import math
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 
-# Load environment variables
-load_dotenv()
+# Heavy third-party modules (openai, PIL, pytesseract, reportlab, requests,
+# dotenv) are imported lazily inside the functions that use them so
+# that --help and dry runs start fast.
 
-# Configuration - Get API keys from environment variables
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-USDA_API_KEY = os.getenv('USDA_API_KEY')
+# Keep each tesseract process single-threaded. Its OpenMP parallelism is
+# inefficient, and the batch already runs several OCR calls at once (each
+# pytesseract call is its own tesseract process), so extra OMP threads
+# would just oversubscribe the CPU.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
 
 # Global variables for clients (initialized when needed)
 client = None
@@ -43,18 +35,50 @@ api_error_detected = False  # Global flag to track API errors
 def initialize_clients():
     """Initialize OpenAI and USDA clients when needed"""
     global client, usda_analyzer
-    
+
+    if client is None or usda_analyzer is None:
+        from dotenv import load_dotenv
+        load_dotenv()
+
     if client is None:
-        if OPENAI_API_KEY:
-            client = OpenAI(api_key=OPENAI_API_KEY)
+        openai_api_key = os.getenv('OPENAI_API_KEY')
+        if openai_api_key:
+            from openai import OpenAI
+            # One shared client for the whole run, backed by a pooled httpx
+            # client with keep-alive connections (and HTTP/2 when the optional
+            # h2 package is installed). Reusing connections avoids paying the
+            # TCP+TLS handshake on every short completion call, which matters
+            # most when several calls run concurrently.
+            http_client = None
+            try:
+                import httpx
+                # keepalive_expiry outlives any pause the rate limiter can
+                # introduce between calls, so pooled connections survive the
+                # whole batch instead of dropping during backoff
+                pool_limits = httpx.Limits(max_connections=32, max_keepalive_connections=32,
+                                           keepalive_expiry=120.0)
+                try:
+                    http_client = httpx.Client(http2=True, timeout=60, limits=pool_limits)
+                except ImportError:
+                    # h2 not installed; HTTP/1.1 keep-alive still pools fine
+                    http_client = httpx.Client(timeout=60, limits=pool_limits)
+            except ImportError:
+                pass
+
+            if http_client is not None:
+                client = OpenAI(api_key=openai_api_key, http_client=http_client)
+            else:
+                client = OpenAI(api_key=openai_api_key)
         else:
             print("❌ OPENAI_API_KEY environment variable not found.")
             print("   Please set OPENAI_API_KEY in your .env file or environment variables.")
             exit(1)
-    
+
     if usda_analyzer is None:
-        if USDA_API_KEY:
-            usda_analyzer = USDANutritionAnalyzer(USDA_API_KEY)
+        usda_api_key = os.getenv('USDA_API_KEY')
+        if usda_api_key:
+            from usda_nutrition import USDANutritionAnalyzer
+            usda_analyzer = USDANutritionAnalyzer(usda_api_key)
         else:
             print("❌ USDA_API_KEY environment variable not found.")
             print("   Please set USDA_API_KEY in your .env file or environment variables.")
@@ -111,18 +135,659 @@ IMAGE_DIR = "./Original-Images/"
 PRODUCTS_DIR = "./Products/"
 MAX_FILENAME_LENGTH = 64
 BATCH_SIZE = 5  # Process images in batches to avoid rate limits
+MAX_CONCURRENT_RECIPES = 4  # Recipes processed in parallel within a batch
+REQUESTS_PER_MINUTE = 60  # Sliding-window cap across all OpenAI calls
+MAX_REQUEST_DELAY = 30.0  # Ceiling for the adaptive per-request delay
 PROCESSED_LOG_FILE = "./processed_images.json"  # Track processed images
+RECIPE_INDEX_FILE = "./recipe_content_index.json"  # Content hash -> product dir, for duplicate recipes
+IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png'})  # Recognized recipe scan formats
+GPT_CACHE_DIR = "./cache/"  # Persistent cache of GPT responses keyed by prompt hash
+SEMANTIC_CACHE_FILE = os.path.join(GPT_CACHE_DIR, "semantic_index.json")
+IMAGE_INDEX_CACHE_FILE = os.path.join(GPT_CACHE_DIR, "image_index.json")  # Sorted IMAGE_DIR listing keyed by dir mtime
+SEMANTIC_SIMILARITY_THRESHOLD = 0.97  # Cosine similarity needed for a semantic cache hit
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant that processes recipe information and generates marketing content."
+
+# Ask the API to guarantee valid JSON output instead of regex-scanning
+# free-form responses for a {...} block
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Detail estimates for recipe types we can recognize straight from the title.
+# Listed in priority order ("cookie bars" counts as cookies, not bars)
+_COOKIE_ESTIMATES = {"servings": "24 cookies", "prep_time": "15 minutes", "cook_time": "12 minutes"}
+_CAKE_ESTIMATES = {"servings": "8 servings", "prep_time": "20 minutes", "cook_time": "45 minutes"}
+_PIE_ESTIMATES = {"servings": "8 servings", "prep_time": "30 minutes", "cook_time": "1 hour"}
+_BROWNIE_ESTIMATES = {"servings": "16 brownies", "prep_time": "15 minutes", "cook_time": "25 minutes"}
+_BAR_ESTIMATES = {"servings": "16 bars", "prep_time": "15 minutes", "cook_time": "25 minutes"}
+
+RECIPE_TYPE_ESTIMATES = {
+    'cookie': _COOKIE_ESTIMATES, 'cookies': _COOKIE_ESTIMATES,
+    'cake': _CAKE_ESTIMATES, 'bread': _CAKE_ESTIMATES,
+    'pie': _PIE_ESTIMATES, 'tart': _PIE_ESTIMATES,
+    'brownie': _BROWNIE_ESTIMATES, 'brownies': _BROWNIE_ESTIMATES,
+    'bar': _BAR_ESTIMATES, 'bars': _BAR_ESTIMATES
+}
+
+# Values that mean "the model didn't know" when merging estimated details
+UNKNOWN_VALUE_PATTERNS = frozenset([
+    'unknown', 'not mentioned', 'n/a', 'none', 'unspecified',
+    'not specified', 'not given', 'missing', 'blank', '',
+    'null', 'undefined', 'tbd', 'to be determined'
+])
+
+# Compiled field checks for merging estimated details. A single regex scan
+# replaces the per-term substring loops that used to run for every field of
+# every recipe. Values are lowercased before matching.
+_SERVING_TERMS_RE = re.compile(r'\d|serving|cookie|slice|piece|loaf|cake|bar|cup|portion')
+_DIGIT_RE = re.compile(r'\d')
+_TIME_UNITS_RE = re.compile(r'minute|hour|second|min|hr|sec')
+
+# Line patterns for re-parsing saved Recipe.txt files in one pass
+_RECIPE_FIELD_RE = re.compile(r'^(Title|Servings|Prep Time|Cook Time):\s*(.*)$')
+_RECIPE_INGREDIENT_RE = re.compile(r'^-\s+(.*)$')
+_RECIPE_INSTRUCTION_RE = re.compile(r'^\d+\.\s+(.*)$')
+_RECIPE_FIELD_KEYS = {'Title': 'title', 'Servings': 'servings',
+                      'Prep Time': 'prep_time', 'Cook Time': 'cook_time'}
+
+# Static instruction blocks for each GPT task. Keeping these as verbatim
+# module constants (instructions first, variable recipe data only in the user
+# message) means OpenAI's prompt caching can reuse the identical prefix across
+# recipes instead of re-processing rebuilt f-strings on every call.
+PARSE_SYSTEM = """You are a helpful assistant that processes recipe information.
+
+Parse the recipe text the user provides into a JSON structure. Extract:
+- title: Recipe name (be specific and descriptive)
+- ingredients: List of ingredients with quantities (each ingredient should be a complete string like "6 egg yolks", "3/4 c. dry farina (cereal)")
+- instructions: Step-by-step cooking instructions
+- servings: Number of servings (if mentioned)
+- prep_time: Preparation time (if mentioned)
+- cook_time: Cooking time (if mentioned)
+
+IMPORTANT: For ingredients, extract the COMPLETE ingredient line including quantity, unit, and ingredient name.
+Do NOT separate quantity and ingredient name. Keep them together as one string per ingredient.
+
+Handle dual-part recipes (like cake + frosting) by separating them clearly.
+Remove any personal names from the recipe.
+
+If the OCR text is unclear or too short, try to extract what you can and make reasonable assumptions.
+If you can't determine specific ingredients, use common ingredients for the type of recipe.
+
+Return only valid JSON with ingredients as complete strings."""
+
+DESCRIBE_SYSTEM = """You are a helpful assistant that generates marketing content for recipes.
+
+Create an enticing Etsy listing description for the vintage recipe the user provides. The description should:
+- Be warm and nostalgic, mentioning family traditions and vintage cookbooks
+- Describe the end result appealingly
+- Mention it's a digital download
+- Include suggested uses (gifting, printing, etc.)
+- Be 2-3 paragraphs long
+
+Write a compelling description."""
+
+ALLERGY_SYSTEM = """You are a helpful assistant that analyzes recipe ingredients.
+
+Analyze the ingredients the user provides for potential allergies. Return a JSON list of allergens.
+
+Common allergens: gluten, dairy, eggs, nuts, soy, shellfish, fish, peanuts
+Consider that "cake mix" contains gluten, "milk" contains dairy, etc.
+
+Return JSON: {"allergens": ["allergen1", "allergen2"]}"""
+
+DIET_SYSTEM = """You are a helpful assistant that analyzes recipes.
+
+Analyze the recipe the user provides for diet compatibility. Return a JSON object.
+
+Check for: vegan, vegetarian, gluten-free, dairy-free, paleo, keto, low-carb, nut-free
+
+Return JSON: {"diets": ["diet1", "diet2"], "not_compatible": ["diet3"]}"""
+
+NUTRITION_SYSTEM = """You are a helpful assistant that estimates recipe nutrition.
+
+Estimate nutrition information for the recipe the user provides. Consider typical serving sizes.
+
+Return JSON with estimated values per serving:
+{"calories": 300, "fat": "12g", "carbs": "45g", "protein": "5g", "fiber": "2g", "sugar": "25g", "sodium": "200mg"}"""
+
+BATCH_CONTENT_SYSTEM = """You are a helpful assistant that processes recipe information and generates marketing content.
+
+From the recipe the user provides, produce ALL of the following fields in one JSON object:
+
+- description: An enticing Etsy listing description. Be warm and nostalgic, mentioning family traditions and vintage cookbooks; describe the end result appealingly; mention it's a digital download; include suggested uses (gifting, printing, etc.); 2-3 paragraphs long.
+- allergens: List of potential allergens in the ingredients (gluten, dairy, eggs, nuts, soy, shellfish, fish, peanuts). Consider that "cake mix" contains gluten, "milk" contains dairy, etc.
+- diets: List of compatible diets (vegan, vegetarian, gluten-free, dairy-free, paleo, keto, low-carb, nut-free).
+- not_compatible: List of incompatible diets from the same set.
+- instagram: An Instagram post with an engaging opening with emojis, a brief description, a call to action, and relevant hashtags.
+- pinterest: A Pinterest description under 500 characters.
+- tags: Exactly 13 relevant Etsy tags (recipe type, vintage/retro themes, digital download, cooking/baking terms).
+- servings: Number of servings (e.g., "6 servings", "24 cookies", "1 loaf").
+- prep_time: Preparation time, always including "minutes" or "hours" (e.g., "20 minutes").
+- cook_time: Cooking/baking time, always including "minutes" or "hours" (e.g., "45 minutes").
+
+Return only valid JSON with exactly these keys."""
+
+# Prompt templates for the per-field generator methods. Built once at import
+# and filled with .format_map() per call, so the hot path only substitutes
+# recipe values instead of re-evaluating a multi-line f-string each time.
+# This also keeps every prompt auditable in one place.
+INSTAGRAM_PROMPT_TMPL = """
+        Create an Instagram post for this recipe. Include:
+        - Engaging opening with emojis
+        - Brief description
+        - Call to action
+        - Relevant hashtags
+
+        Recipe: {title}
+        Description: {description}...
+
+        Format with emojis and hashtags.
+        """
+
+PINTEREST_PROMPT_TMPL = """
+        Create a Pinterest description for this recipe. Keep it under 500 characters.
+
+        Recipe: {title}
+        Description: {description}...
+        """
+
+ESTIMATE_PROMPT_TMPL = """
+        Analyze this recipe and estimate the missing details. Return only a JSON object with these fields:
+        - servings: Number of servings (e.g., "6 servings", "24 cookies", "1 loaf")
+        - prep_time: Preparation time (e.g., "15 minutes", "30 minutes")
+        - cook_time: Cooking/baking time (e.g., "45 minutes", "1 hour", "12-15 minutes")
+
+        Recipe: {title}
+        Ingredients: {ingredients}
+        Instructions: {instructions}
+
+        Consider:
+        - Recipe type (cookies, cake, bread, etc.)
+        - Ingredient quantities
+        - Number of steps
+        - Typical cooking methods mentioned
+
+        IMPORTANT: Always use standardized formats:
+        - servings: Use "X servings" for general recipes, "X cookies/bars" for cookies, "1 loaf/cake" for breads/cakes
+        - prep_time: Always include "minutes" or "hours" (e.g., "20 minutes", "1 hour")
+        - cook_time: Always include "minutes" or "hours" (e.g., "45 minutes", "1 hour")
+
+        Return only valid JSON: {{"servings": "X servings", "prep_time": "X minutes", "cook_time": "X minutes"}}
+        """
+
+TAGS_PROMPT_TMPL = """
+        Generate 13 relevant Etsy tags for this recipe listing. Include:
+        - Recipe type
+        - Vintage/retro themes
+        - Digital download
+        - Cooking/baking terms
+
+        Recipe: {title}
+        Description: {description}...
+
+        Return as comma-separated list.
+        """
+
+IMAGE_PROMPTS_TMPL = """
+        Analyze this recipe and create two coordinated image prompts for professional food photography.
+
+        Recipe Title: {title}
+        Servings: {servings}
+        Prep Time: {prep_time}
+        Cook Time: {cook_time}
+
+        Ingredients:
+        {ingredients}
+
+        Instructions:
+        {instructions}
+
+        Create two coordinated image prompts:
+
+        1. MAIN IMAGE (finished product): Professional food photography of the complete recipe fresh out of the oven
+        2. SERVING IMAGE (individual portion): Close-up of a single serving that visually matches the main image
+
+        Both images should:
+        - Have consistent styling, lighting, and aesthetic
+        - Show the same recipe with the same visual characteristics
+        - Use vintage/rustic presentation
+        - Be high quality with no text or watermarks
+        - Include specific visual details based on the recipe ingredients and cooking method
+
+        Return as JSON:
+        {{
+            "main_image": "detailed prompt for main image",
+            "serving_image": "detailed prompt for serving image"
+        }}
+        """
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
+def stringify_item(item):
+    """Coerce a parsed ingredient/instruction entry to a plain string
+
+    GPT sometimes returns ingredients as {"quantity": ..., "ingredient": ...}
+    dicts instead of plain strings.
+    """
+    # Fast path: parsed entries are normally already plain strings
+    if type(item) is str:
+        return item
+    if isinstance(item, dict):
+        if 'ingredient' in item and 'quantity' in item:
+            return f"{item['quantity']} {item['ingredient']}"
+        elif 'ingredient' in item:
+            return item['ingredient']
+        elif 'quantity' in item:
+            return item['quantity']
+        else:
+            # Try to get the first value
+            return str(next(iter(item.values()), item))
+    return str(item)
+
+def normalize_recipe(recipe_data):
+    """Stringified (ingredients, instructions) tuples for a parsed recipe
+
+    Cached on the recipe dict so the plain and fancy PDF builders (and a
+    fancy-card fallback rerun) share one stringify pass. Tuples keep the
+    cached lists safely immutable.
+    """
+    cached = recipe_data.get('__norm__')
+    if cached is None:
+        cached = (
+            tuple(stringify_item(ing) for ing in recipe_data.get('ingredients', [])),
+            tuple(stringify_item(inst) for inst in recipe_data.get('instructions', []))
+        )
+        recipe_data['__norm__'] = cached
+    return cached
+
+# fpdf2's core Helvetica only encodes latin-1, and GPT output and OCR'd
+# vintage cards routinely contain curly quotes, dashes, and unicode
+# fractions. Map the common offenders to latin-1 equivalents (½/¼/¾ are
+# already latin-1) and replace anything else, instead of letting
+# pdf.output() raise and lose the whole card.
+_LATIN1_FALLBACKS = str.maketrans({
+    '‘': "'", '’': "'", '‚': "'", '“': '"', '”': '"',
+    '–': '-', '—': '--', '…': '...', '•': '-',
+    '′': "'", '″': '"', '⁄': '/',
+    '⅓': '1/3', '⅔': '2/3', '⅕': '1/5', '⅖': '2/5',
+    '⅗': '3/5', '⅘': '4/5', '⅙': '1/6', '⅚': '5/6',
+    '⅛': '1/8', '⅜': '3/8', '⅝': '5/8', '⅞': '7/8',
+})
+
+
+def latin1_safe(text):
+    """Coerce text to characters fpdf2's core fonts can encode"""
+    return str(text).translate(_LATIN1_FALLBACKS).encode('latin-1', 'replace').decode('latin-1')
+
+
+def render_recipe_pdf(recipe_data, nutrition, output_path):
+    """Create beautiful recipe PDF
+
+    Module-level so batch runs can dispatch renders to worker processes.
+    """
+    try:
+        # fpdf2 streams cells directly instead of running ReportLab's
+        # flowable layout engine, which dominates render time on the
+        # plain recipe card (the fancy builders still use ReportLab)
+        from fpdf import FPDF
+
+        # Ensure ingredients and instructions are strings
+        ingredients, instructions = normalize_recipe(recipe_data)
+
+        pdf = FPDF(format='letter')
+        pdf.set_auto_page_break(auto=True, margin=15)
+        pdf.add_page()
+
+        # Title
+        pdf.set_font('Helvetica', 'B', 24)
+        pdf.multi_cell(0, 12, latin1_safe(recipe_data['title']), align='C')
+        pdf.ln(8)
+
+        # Recipe details
+        details_text = f"Servings: {recipe_data.get('servings', 'Unknown')} | Prep Time: {recipe_data.get('prep_time', 'Unknown')} | Cook Time: {recipe_data.get('cook_time', 'Unknown')}"
+        pdf.set_font('Helvetica', '', 11)
+        pdf.multi_cell(0, 6, latin1_safe(details_text))
+        pdf.ln(6)
+
+        # Ingredients
+        pdf.set_font('Helvetica', 'B', 16)
+        pdf.cell(0, 10, "Ingredients", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font('Helvetica', '', 11)
+        for ingredient in ingredients:
+            pdf.multi_cell(0, 6, latin1_safe(f"- {ingredient}"))
+        pdf.ln(6)
+
+        # Instructions
+        pdf.set_font('Helvetica', 'B', 16)
+        pdf.cell(0, 10, "Instructions", new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font('Helvetica', '', 11)
+        for i, instruction in enumerate(instructions, 1):
+            pdf.multi_cell(0, 6, latin1_safe(f"{i}. {instruction}"))
+        pdf.ln(6)
+
+        # Nutrition info
+        if nutrition.get('calories') != "Unknown":
+            pdf.set_font('Helvetica', 'B', 16)
+            pdf.cell(0, 10, "Nutrition Information (per serving)", new_x="LMARGIN", new_y="NEXT")
+            nutrition_text = f"Calories: {nutrition.get('calories', 'Unknown')} | Fat: {nutrition.get('fat', 'Unknown')} | Carbs: {nutrition.get('carbs', 'Unknown')} | Protein: {nutrition.get('protein', 'Unknown')}"
+            if nutrition.get('fiber') != "Unknown":
+                nutrition_text += f" | Fiber: {nutrition.get('fiber', 'Unknown')}"
+            if nutrition.get('sugar') != "Unknown":
+                nutrition_text += f" | Sugar: {nutrition.get('sugar', 'Unknown')}"
+            if nutrition.get('sodium') != "Unknown":
+                nutrition_text += f" | Sodium: {nutrition.get('sodium', 'Unknown')}"
+            pdf.set_font('Helvetica', '', 11)
+            pdf.multi_cell(0, 6, latin1_safe(nutrition_text))
+
+        pdf.output(output_path)
+        logger.info(f"📄 PDF created: {output_path}")
+
+    except Exception as e:
+        logger.error(f"PDF creation error: {e}")
+
+
+# Shared styles for the fancy PDF builders. reportlab stays lazily imported
+# so --help and dry runs start fast, but the ParagraphStyle/TableStyle
+# objects are built once on first render and reused for every recipe in the
+# run instead of being reconstructed per call.
+_FANCY_PDF_STYLES = None
+
+
+def _get_fancy_pdf_styles():
+    """Build (once) and return the style set used by the fancy PDF builders"""
+    global _FANCY_PDF_STYLES
+    if _FANCY_PDF_STYLES is None:
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.platypus import TableStyle
+
+        styles = getSampleStyleSheet()
+        _FANCY_PDF_STYLES = {
+            'title': ParagraphStyle(
+                'FancyTitle',
+                parent=styles['Heading1'],
+                fontSize=28,
+                spaceAfter=20,
+                alignment=TA_CENTER,
+                textColor=colors.darkred,
+                fontName='Helvetica-Bold'
+            ),
+            'subtitle': ParagraphStyle(
+                'FancySubtitle',
+                parent=styles['Normal'],
+                fontSize=14,
+                spaceAfter=15,
+                alignment=TA_CENTER,
+                textColor=colors.darkgreen,
+                fontName='Helvetica'
+            ),
+            'section': ParagraphStyle(
+                'FancySection',
+                parent=styles['Heading2'],
+                fontSize=18,
+                spaceAfter=10,
+                spaceBefore=15,
+                textColor=colors.darkblue,
+                fontName='Helvetica-Bold'
+            ),
+            'ingredient': ParagraphStyle(
+                'FancyIngredient',
+                parent=styles['Normal'],
+                fontSize=12,
+                spaceAfter=3,
+                leftIndent=20,
+                fontName='Helvetica'
+            ),
+            'instruction': ParagraphStyle(
+                'FancyInstruction',
+                parent=styles['Normal'],
+                fontSize=12,
+                spaceAfter=8,
+                leftIndent=20,
+                fontName='Helvetica'
+            ),
+            'nutrition': ParagraphStyle(
+                'FancyNutrition',
+                parent=styles['Normal'],
+                fontSize=10,
+                spaceAfter=5,
+                fontName='Helvetica-Oblique'
+            ),
+            'footer': ParagraphStyle(
+                'Footer',
+                parent=styles['Normal'],
+                fontSize=8,
+                alignment=TA_CENTER,
+                textColor=colors.grey,
+                fontName='Helvetica-Oblique'
+            ),
+            'layout_table': TableStyle([
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('LEFTPADDING', (0, 0), (-1, -1), 10),
+                ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+                ('TOPPADDING', (0, 0), (-1, -1), 5),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+            ]),
+            'nutrition_table': TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 1), (-1, -1), 10),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ]),
+        }
+    return _FANCY_PDF_STYLES
+
+
+@functools.lru_cache(maxsize=256)
+def _load_image_reader(path):
+    """Decoded product image wrapped for reportlab, cached across renders
+
+    Batch regen builds several PDF variants from the same generated PNGs;
+    caching the ImageReader means each file is decoded once per run instead
+    of once per flowable. maxsize bounds the memory held by decoded images.
+    """
+    from PIL import Image as PILImage
+    from reportlab.lib.utils import ImageReader
+
+    return ImageReader(PILImage.open(path))
+
+
+def _atomic_write_json(path, data, **dump_kwargs):
+    """Write JSON to path via a temp file and os.replace
+
+    A crash mid-dump would otherwise leave a truncated state file, which
+    the loaders treat as empty — silently forgetting every processed
+    image. os.replace swaps the complete file in atomically.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, **dump_kwargs)
+    os.replace(tmp_path, path)
+
+
+_FANCY_FRAME_GEOM = None
+
+def _get_fancy_frame_geometry():
+    """Coordinates for the fancy-card frame, computed once per process
+
+    The unit arithmetic depends on reportlab's letter/inch (lazily
+    imported), so the values are built on first render and reused by
+    every document after, same pattern as _get_fancy_pdf_styles().
+    """
+    global _FANCY_FRAME_GEOM
+    if _FANCY_FRAME_GEOM is None:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+
+        width, height = letter
+        _FANCY_FRAME_GEOM = {
+            'border': (0.25*inch, 0.25*inch, width-0.5*inch, height-0.5*inch),
+            'corners': ((0.25*inch, height-0.75*inch),
+                        (width-0.75*inch, height-0.75*inch),
+                        (0.25*inch, 0.25*inch),
+                        (width-0.75*inch, 0.25*inch)),
+            'corner_radius': 0.1*inch,
+            'tick_ys': tuple(1*inch + i * 1.5*inch for i in range(5)),
+            'tick_xs': (0.3*inch, 0.5*inch, width-0.5*inch, width-0.3*inch),
+        }
+    return _FANCY_FRAME_GEOM
+
+
+def _draw_fancy_page_decorations(canvas_obj, doc):
+    """Draw the border, corner dots, and side ticks on a fancy-card page
+
+    Passed to SimpleDocTemplate.build as the onFirstPage/onLaterPages
+    callback so the decoration is layered into the same render pass as the
+    page content. The drawing is recorded once per document as a PDF form
+    (XObject); every page after the first just references it, so multi-page
+    cards pay the ~15 primitive calls a single time.
+    """
+    from reportlab.lib import colors
+
+    if not canvas_obj.hasForm("fancy_frame"):
+        geom = _get_fancy_frame_geometry()
+        canvas_obj.beginForm("fancy_frame")
+        canvas_obj.saveState()
+
+        # Decorative border
+        canvas_obj.setStrokeColor(colors.darkred)
+        canvas_obj.setLineWidth(3)
+        canvas_obj.rect(*geom['border'])
+
+        # Corner decorations
+        canvas_obj.setFillColor(colors.darkred)
+        for x, y in geom['corners']:
+            canvas_obj.circle(x, y, geom['corner_radius'], fill=1)
+
+        # Side decorations, coalesced into one path so the ten tick-marks
+        # stroke in a single draw call
+        canvas_obj.setStrokeColor(colors.darkgreen)
+        canvas_obj.setLineWidth(1)
+        left_a, left_b, right_a, right_b = geom['tick_xs']
+        ticks = canvas_obj.beginPath()
+        for y in geom['tick_ys']:
+            ticks.moveTo(left_a, y)
+            ticks.lineTo(left_b, y)
+            ticks.moveTo(right_a, y)
+            ticks.lineTo(right_b, y)
+        canvas_obj.drawPath(ticks, stroke=1, fill=0)
+
+        canvas_obj.restoreState()
+        canvas_obj.endForm()
+
+    canvas_obj.doForm("fancy_frame")
+
+
+class RateLimiter:
+    """Adaptive pacing for OpenAI calls, shared by every request in a run
+
+    Keeps a sliding one-minute window of request timestamps so we never
+    exceed REQUESTS_PER_MINUTE, plus an AIMD per-request delay: successes
+    trim the delay additively, rate-limit responses double it and honor the
+    provider's Retry-After when present. Replaces the old fixed
+    time.sleep(2)/time.sleep(30) pacing, which over-slept when the account
+    had headroom and under-slept near the limit.
+    """
+
+    def __init__(self, requests_per_minute=None):
+        from collections import deque
+        self.requests_per_minute = requests_per_minute or REQUESTS_PER_MINUTE
+        self._timestamps = deque()
+        self._delay = 0.0
+        self._not_before = 0.0
+        self._last_request = 0.0
+        self._lock = threading.Lock()
+
+    def wait_if_throttled(self):
+        """Block until a request is allowed, then reserve a window slot"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= 60:
+                    self._timestamps.popleft()
+
+                wait = max(self._not_before - now,
+                           self._last_request + self._delay - now)
+                if len(self._timestamps) >= self.requests_per_minute:
+                    wait = max(wait, 60 - (now - self._timestamps[0]))
+
+                if wait <= 0:
+                    self._timestamps.append(now)
+                    self._last_request = now
+                    return
+            time.sleep(min(wait, 5))
+
+    def cooldown_if_needed(self):
+        """Between batches: sleep only as long as provider feedback requires
+
+        With quota headroom this is a no-op; after a rate-limit response it
+        waits exactly until the provider's Retry-After horizon instead of a
+        blanket pause.
+        """
+        with self._lock:
+            wait = max(0.0, self._not_before - time.monotonic())
+        if wait:
+            logger.info(f"⏳ Cooling down {wait:.1f}s before next batch (rate-limit feedback)")
+            time.sleep(wait)
+
+    def record_success(self):
+        """Additive decrease: claw back headroom after a clean response"""
+        with self._lock:
+            self._delay = max(0.0, self._delay - 0.5)
+
+    def record_rate_limit(self, retry_after=None):
+        """Multiplicative increase after a 429/5xx, honoring Retry-After"""
+        with self._lock:
+            self._delay = min(MAX_REQUEST_DELAY, max(1.0, self._delay * 2))
+            if retry_after:
+                try:
+                    self._not_before = time.monotonic() + float(retry_after)
+                except (TypeError, ValueError):
+                    pass
+            logger.warning(f"🐢 Rate limited - request delay now {self._delay:.1f}s")
+
+
 class RecipeProcessor:
-    def __init__(self, ocr_method='vision-api'):
+    def __init__(self, ocr_method='vision-api', use_cache=True):
         self.processed_count = 0
         self.failed_count = 0
         self.ocr_method = ocr_method
+        self.use_cache = use_cache
+        # Structured extraction (tags, estimates, allergens, diet) doesn't
+        # need GPT-4-class reasoning; route it to a cheaper model
+        self.cheap_model = "gpt-4o-mini"
+        # JSON mode (response_format={"type": "json_object"}) is rejected by
+        # base gpt-4 with a 400; structured calls that need full reasoning
+        # go to gpt-4o instead
+        self.json_model = "gpt-4o"
+        self._semantic_index = None  # Loaded lazily on first semantic lookup
+        self._token_encoder = None  # tiktoken encoder, loaded on first use
+        self._pdf_pool = None  # Shared worker pool for CPU-bound PDF rendering
+        self._original_to_product = None  # original image name -> product dir, built on first use
+        self._image_files = None  # Sorted IMAGE_DIR scan, done once per run
+        self._recipe_cache = {}  # image name -> parsed recipe_data from this run
         self.processed_images = self.load_processed_images()
+        # Derived lookup sets so batch filters answer membership in O(1)
+        # instead of probing the metadata dict per file
+        self._processed_set = set(self.processed_images)
+        self._with_images_set = {name for name, info in self.processed_images.items()
+                                 if info.get('images_generated')}
+        self.recipe_index = self.load_recipe_index()
+        # Guards the persisted JSON logs when recipes run concurrently
+        self._state_lock = threading.Lock()
+        # Adaptive pacing shared by every OpenAI call in this run
+        self.rate_limiter = RateLimiter()
         # Initialize clients when RecipeProcessor is created
         initialize_clients()
     
@@ -139,43 +804,107 @@ class RecipeProcessor:
     def save_processed_images(self):
         """Save list of processed images"""
         try:
-            with open(PROCESSED_LOG_FILE, 'w') as f:
-                json.dump(self.processed_images, f, indent=2)
+            _atomic_write_json(PROCESSED_LOG_FILE, self.processed_images, indent=2)
         except Exception as e:
             logger.error(f"Could not save processed images log: {e}")
     
+    def load_recipe_index(self):
+        """Load the content-hash index of already generated product folders"""
+        try:
+            if os.path.exists(RECIPE_INDEX_FILE):
+                with open(RECIPE_INDEX_FILE, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load recipe content index: {e}")
+        return {}
+
+    def save_recipe_index(self):
+        """Save the content-hash index of generated product folders"""
+        try:
+            _atomic_write_json(RECIPE_INDEX_FILE, self.recipe_index, indent=2)
+        except Exception as e:
+            logger.error(f"Could not save recipe content index: {e}")
+
+    def recipe_content_id(self, recipe_data):
+        """Stable short hash of parsed recipe content
+
+        Two scans of the same card parse to identical recipe_data, so the
+        hash lets us spot duplicates before paying for the downstream
+        content, PDF, and image generation again.
+        """
+        payload = json.dumps(recipe_data, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
     def mark_image_processed(self, image_path, recipe_title, success=True, images_generated=False):
         """Mark an image as processed"""
         image_name = os.path.basename(image_path)
-        self.processed_images[image_name] = {
-            'processed_at': datetime.now().isoformat(),
-            'recipe_title': recipe_title,
-            'success': success,
-            'ocr_method': self.ocr_method,
-            'images_generated': images_generated
-        }
-        self.save_processed_images()
+        with self._state_lock:
+            self.processed_images[image_name] = {
+                'processed_at': datetime.now().isoformat(),
+                'recipe_title': recipe_title,
+                'success': success,
+                'ocr_method': self.ocr_method,
+                'images_generated': images_generated
+            }
+            self._processed_set.add(image_name)
+            if images_generated:
+                self._with_images_set.add(image_name)
+            self.save_processed_images()
     
     def mark_images_generated(self, image_path):
         """Mark that images have been generated for this recipe"""
         image_name = os.path.basename(image_path)
-        if image_name in self.processed_images:
-            self.processed_images[image_name]['images_generated'] = True
-            self.save_processed_images()
+        if image_name in self._processed_set:
+            with self._state_lock:
+                self.processed_images[image_name]['images_generated'] = True
+                self._with_images_set.add(image_name)
+                self.save_processed_images()
             logger.info(f"📸 Marked images as generated for {image_name}")
-    
+
     def has_images_generated(self, image_path):
         """Check if images have been generated for this recipe"""
-        image_name = os.path.basename(image_path)
-        if image_name in self.processed_images:
-            return self.processed_images[image_name].get('images_generated', False)
-        return False
-    
+        return os.path.basename(image_path) in self._with_images_set
+
     def is_image_processed(self, image_path):
         """Check if an image has already been processed"""
-        image_name = os.path.basename(image_path)
-        return image_name in self.processed_images
+        return os.path.basename(image_path) in self._processed_set
         
+    def list_recipe_images(self):
+        """Sorted image filenames in IMAGE_DIR, scanned once per run
+
+        scandir with a suffix check against IMAGE_EXTENSIONS avoids the
+        per-entry stat and full lowercase copies of the old
+        listdir/lower/endswith filter, and the cached result lets the batch
+        and image-only entry points share one directory scan. The listing
+        is also persisted keyed by the directory mtime, so repeated
+        invocations (shell loops over --single) skip the rescan entirely
+        unless images were added or removed.
+        """
+        if self._image_files is None:
+            dir_mtime = os.stat(IMAGE_DIR).st_mtime_ns
+            try:
+                with open(IMAGE_INDEX_CACHE_FILE, 'r') as f:
+                    cached = json.load(f)
+                if cached.get('mtime') == dir_mtime:
+                    self._image_files = cached['files']
+                    return self._image_files
+            except (FileNotFoundError, json.JSONDecodeError, KeyError):
+                pass
+
+            with os.scandir(IMAGE_DIR) as entries:
+                files = [entry.name for entry in entries
+                         if entry.is_file(follow_symlinks=False)
+                         and entry.name.rpartition('.')[2].lower() in IMAGE_EXTENSIONS]
+            files.sort()
+            self._image_files = files
+            try:
+                os.makedirs(GPT_CACHE_DIR, exist_ok=True)
+                _atomic_write_json(IMAGE_INDEX_CACHE_FILE,
+                                   {'mtime': dir_mtime, 'files': files})
+            except Exception as e:
+                logger.warning(f"Could not save image index cache: {e}")
+        return self._image_files
+
     def slugify(self, text):
         """Convert text to URL-friendly slug"""
         text = re.sub(r'[^a-zA-Z0-9\s]+', '', text.lower())
@@ -186,15 +915,85 @@ class RecipeProcessor:
         """Generate random hash for unique identifiers"""
         return ''.join(random.choices('0123456789abcdef', k=6))
     
+    def is_text_candidate(self, image_path):
+        """Quick local check that an image could plausibly contain recipe text
+
+        Rejects tiny, blank, or near-uniform images before we spend a paid
+        Vision API call (or a slow Tesseract pass) on them.
+        """
+        try:
+            from PIL import Image, ImageStat
+
+            image = Image.open(image_path).convert('L')
+            width, height = image.size
+
+            # Too small to hold readable recipe text
+            if min(width, height) < 200:
+                logger.warning(f"⏭️  Skipping {os.path.basename(image_path)}: image too small ({width}x{height})")
+                return False
+
+            # Near-zero contrast means a blank or uniform image
+            stat = ImageStat.Stat(image)
+            if stat.stddev[0] < 8:
+                logger.warning(f"⏭️  Skipping {os.path.basename(image_path)}: image appears blank (stddev={stat.stddev[0]:.1f})")
+                return False
+
+            return True
+        except Exception as e:
+            # If the pre-check itself fails, let the OCR path report the error
+            logger.warning(f"Image pre-check failed for {image_path}: {e}")
+            return True
+
+    @staticmethod
+    def _binarize_for_ocr(image):
+        """Otsu-threshold a grayscale image before handing it to tesseract
+
+        Cleaner black-on-white input lets tesseract's classifier converge
+        faster and cuts the junk lines the cleanup pass below has to
+        discard. The threshold search only touches the 256-bin histogram
+        and the thresholding is one point() table lookup in C.
+        """
+        hist = image.histogram()
+        total = sum(hist)
+        sum_all = sum(i * h for i, h in enumerate(hist))
+
+        sum_b = 0.0
+        w_b = 0
+        best_variance = 0.0
+        threshold = 127
+
+        for i, h in enumerate(hist):
+            w_b += h
+            if w_b == 0:
+                continue
+            w_f = total - w_b
+            if w_f == 0:
+                break
+            sum_b += i * h
+            mean_b = sum_b / w_b
+            mean_f = (sum_all - sum_b) / w_f
+            variance = w_b * w_f * (mean_b - mean_f) ** 2
+            if variance > best_variance:
+                best_variance = variance
+                threshold = i
+
+        return image.point([255 if i > threshold else 0 for i in range(256)])
+
     def extract_text_from_image(self, image_path):
         """Extract text from recipe image using OCR"""
         try:
+            import pytesseract
+            from PIL import Image
+
+            if not self.is_text_candidate(image_path):
+                return ""
+
             image = Image.open(image_path)
-            
+
             # Enhanced preprocessing for better OCR
             # Convert to grayscale
             image = image.convert('L')
-            
+
             # Resize if too small (helps with OCR accuracy)
             width, height = image.size
             if width < 800 or height < 600:
@@ -202,7 +1001,10 @@ class RecipeProcessor:
                 new_width = int(width * scale_factor)
                 new_height = int(height * scale_factor)
                 image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
+
+            # Binarize so tesseract sees clean black-on-white text
+            image = self._binarize_for_ocr(image)
+
             # Try different OCR configurations for better results
             text = ""
             
@@ -236,7 +1038,8 @@ class RecipeProcessor:
                 line = line.strip()
                 if line and len(line) > 2:  # Remove very short lines
                     # Remove lines that are mostly symbols or numbers
-                    if len([c for c in line if c.isalnum()]) > len(line) * 0.3:
+                    # (sum(map(...)) counts in C without building a throwaway list)
+                    if sum(map(str.isalnum, line)) > len(line) * 0.3:
                         cleaned_lines.append(line)
             
             cleaned_text = '\n'.join(cleaned_lines)
@@ -246,9 +1049,22 @@ class RecipeProcessor:
             logger.error(f"OCR failed on {image_path}: {e}")
             return ""
     
+    def _throttle_feedback(self, e, error_msg):
+        """Feed an API failure into the rate limiter if it was throttling"""
+        if '429' in error_msg or 'rate limit' in error_msg.lower():
+            response = getattr(e, 'response', None)
+            headers = getattr(response, 'headers', None) or {}
+            self.rate_limiter.record_rate_limit(headers.get('retry-after'))
+
     def extract_text_with_vision_api(self, image_path):
         """Extract text from recipe image using ChatGPT's vision API"""
         try:
+            # Cheap local gate before paying for a Vision API call
+            if not self.is_text_candidate(image_path):
+                return ""
+
+            self.rate_limiter.wait_if_throttled()
+
             # Read the image file
             with open(image_path, "rb") as image_file:
                 # Use ChatGPT's vision model for OCR
@@ -276,136 +1092,455 @@ class RecipeProcessor:
                 
                 extracted_text = response.choices[0].message.content.strip()
                 logger.info(f"Vision API extracted {len(extracted_text)} characters from {os.path.basename(image_path)}")
+                self.rate_limiter.record_success()
                 return extracted_text
-                
+
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Vision API OCR failed on {image_path}: {error_msg}")
-            
+            self._throttle_feedback(e, error_msg)
+
             # Check if this is a critical API error that should stop processing
             if check_api_error_and_exit(error_msg, "OpenAI Vision API"):
                 return None  # Signal to calling function that processing should stop
             
             return ""
     
-    def ask_gpt(self, prompt, model="gpt-4", temperature=0.4):
+    def _gpt_cache_path(self, prompt, model, system):
+        """Build the on-disk cache path for a GPT request"""
+        key = hashlib.sha256(f"{model}|{system or DEFAULT_SYSTEM_PROMPT}|{prompt}".encode('utf-8')).hexdigest()
+        return os.path.join(GPT_CACHE_DIR, f"{key}.json")
+
+    def _read_cached_response(self, cache_path):
+        """Load a cached GPT response, or None if not cached"""
+        try:
+            if os.path.exists(cache_path):
+                with open(cache_path, 'r') as f:
+                    return json.load(f)['response']
+        except Exception as e:
+            logger.warning(f"Could not read GPT cache entry {cache_path}: {e}")
+        return None
+
+    def _write_cached_response(self, cache_path, response):
+        """Persist a GPT response for future runs"""
+        try:
+            os.makedirs(GPT_CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'w') as f:
+                json.dump({'response': response}, f)
+        except Exception as e:
+            logger.warning(f"Could not write GPT cache entry {cache_path}: {e}")
+
+    def _embed_prompt(self, prompt):
+        """Get an embedding vector for a prompt, or None if embedding fails"""
+        try:
+            response = client.embeddings.create(model=EMBEDDING_MODEL, input=prompt)
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(f"Prompt embedding failed: {e}")
+            return None
+
+    @staticmethod
+    def _cosine_similarity(a, b):
+        """Cosine similarity between two embedding vectors"""
+        dot = sum(x * y for x, y in zip(a, b))
+        norm_a = math.sqrt(sum(x * x for x in a))
+        norm_b = math.sqrt(sum(x * x for x in b))
+        if not norm_a or not norm_b:
+            return 0.0
+        return dot / (norm_a * norm_b)
+
+    def _load_semantic_index(self):
+        """Load the (embedding, response) index used for near-duplicate prompts
+
+        Double-checked under the state lock: recipe threads race here on
+        first use, and two unsynchronized loaders would leave one thread
+        appending to an orphaned list. The index is assigned only once
+        fully loaded so no thread can observe a partial load.
+        """
+        if self._semantic_index is None:
+            with self._state_lock:
+                if self._semantic_index is None:
+                    index = []
+                    try:
+                        if os.path.exists(SEMANTIC_CACHE_FILE):
+                            with open(SEMANTIC_CACHE_FILE, 'r') as f:
+                                index = json.load(f)
+                    except Exception as e:
+                        logger.warning(f"Could not load semantic cache index: {e}")
+                    self._semantic_index = index
+        return self._semantic_index
+
+    def _semantic_lookup(self, embedding):
+        """Return the cached response for the nearest prompt above threshold"""
+        best_score = 0.0
+        best_response = None
+        for entry in self._load_semantic_index():
+            score = self._cosine_similarity(embedding, entry['embedding'])
+            if score > best_score:
+                best_score = score
+                best_response = entry['response']
+        if best_score >= SEMANTIC_SIMILARITY_THRESHOLD:
+            return best_response
+        return None
+
+    def _semantic_store(self, embedding, response):
+        """Add a (embedding, response) pair to the semantic cache
+
+        Append and rewrite happen under the state lock: the write replaces
+        the whole file, so two unserialized stores would race and the last
+        writer would silently drop the other's entry. The load runs first,
+        outside the lock, because it takes the same (non-reentrant) lock.
+        """
+        index = self._load_semantic_index()
+        with self._state_lock:
+            index.append({'embedding': embedding, 'response': response})
+            try:
+                os.makedirs(GPT_CACHE_DIR, exist_ok=True)
+                _atomic_write_json(SEMANTIC_CACHE_FILE, index)
+            except Exception as e:
+                logger.warning(f"Could not save semantic cache index: {e}")
+
+    def _cap_tokens(self, text, max_tokens):
+        """Trim text to a token budget before it goes into a prompt
+
+        Long instruction lists dominate prompt size, and tokens dominate API
+        latency and cost. Uses tiktoken when available; otherwise falls back
+        to a ~4-chars-per-token character budget.
+        """
+        if self._token_encoder is None:
+            try:
+                import tiktoken
+                self._token_encoder = tiktoken.encoding_for_model("gpt-4")
+            except Exception:
+                self._token_encoder = False
+
+        if self._token_encoder is False:
+            limit = max_tokens * 4
+            return text if len(text) <= limit else text[:limit]
+
+        ids = self._token_encoder.encode(text)
+        if len(ids) <= max_tokens:
+            return text
+        return self._token_encoder.decode(ids[:max_tokens])
+
+    def ask_gpt(self, prompt, model="gpt-4", temperature=0.4, system=None, response_format=None, semantic=False):
         """Make API call to OpenAI"""
+        # GPT output is a pure function of (model, system, prompt) for our
+        # purposes, so reruns and duplicate recipes can reuse cached responses
+        # instead of paying for the API call again
+        cache_path = None
+        embedding = None
+        if self.use_cache:
+            cache_path = self._gpt_cache_path(prompt, model, system)
+            cached = self._read_cached_response(cache_path)
+            if cached is not None:
+                logger.info("💾 Using cached GPT response")
+                return cached
+
+            # For templated prompts (tags, social posts) an embedding lookup
+            # also catches near-duplicate recipes the exact hash misses
+            if semantic:
+                embedding = self._embed_prompt(prompt)
+                if embedding:
+                    hit = self._semantic_lookup(embedding)
+                    if hit is not None:
+                        logger.info("💾 Using semantically cached GPT response")
+                        return hit
+
         try:
+            self.rate_limiter.wait_if_throttled()
+            kwargs = {}
+            if response_format:
+                kwargs['response_format'] = response_format
             response = client.chat.completions.create(
                 model=model,
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant that processes recipe information and generates marketing content."},
+                    {"role": "system", "content": system or DEFAULT_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=temperature
+                temperature=temperature,
+                **kwargs
             )
-            return response.choices[0].message.content.strip()
+            result = response.choices[0].message.content.strip()
+            self.rate_limiter.record_success()
+            if cache_path:
+                self._write_cached_response(cache_path, result)
+            if embedding:
+                self._semantic_store(embedding, result)
+            return result
         except Exception as e:
             error_msg = str(e)
             logger.error(f"OpenAI error: {error_msg}")
-            
+            self._throttle_feedback(e, error_msg)
+
             # Check if this is a critical API error that should stop processing
             if check_api_error_and_exit(error_msg, "OpenAI GPT"):
                 return None  # Signal to calling function that processing should stop
-            
+
+            # A 4xx invalid-request error means the call itself is wrong
+            # (bad model/parameter combination) and every retry will fail
+            # the same way; make that loud instead of degrading silently
+            # into the fallback paths
+            status_code = getattr(getattr(e, 'response', None), 'status_code', None)
+            if status_code == 400 or 'invalid_request' in error_msg.lower() or 'unsupported' in error_msg.lower():
+                logger.error(f"❌ Invalid request rejected by the API (model={model}, "
+                             f"response_format={response_format}) - fix the call, retrying will not help")
+
             return ""
     
+    def ask_gpt_batch(self, prompts, model="gpt-4", temperature=0.4, system=None,
+                      poll_interval=30, timeout=24 * 3600):
+        """Run many prompts through the OpenAI Batch API in one submission
+
+        Batch completions cost about half the synchronous per-token price
+        and don't consume interactive rate-limit budget, at the cost of
+        turnaround measured in minutes to hours. Use this for offline bulk
+        enrichment of a backlog, not inside the interactive pipeline.
+        Prompts already in the GPT cache are answered locally; only the
+        misses are uploaded. Returns one response per prompt, in order,
+        with "" for any prompt the batch failed to answer.
+        """
+        results = [None] * len(prompts)
+        pending = []
+        for i, prompt in enumerate(prompts):
+            cache_path = self._gpt_cache_path(prompt, model, system) if self.use_cache else None
+            if cache_path:
+                cached = self._read_cached_response(cache_path)
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            pending.append((i, prompt, cache_path))
+
+        if not pending:
+            logger.info(f"💾 All {len(prompts)} batch prompts served from cache")
+            return results
+
+        lines = []
+        for i, prompt, _ in pending:
+            lines.append(json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": system or DEFAULT_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": temperature,
+                },
+            }))
+
+        try:
+            batch_input = client.files.create(
+                file=("recipe_batch.jsonl", "\n".join(lines).encode('utf-8')),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=batch_input.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"📤 Submitted batch {batch.id} with {len(pending)} prompts")
+
+            deadline = time.time() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.time() > deadline:
+                    logger.error(f"Batch {batch.id} timed out in status {batch.status}")
+                    break
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error(f"Batch {batch.id} ended in status {batch.status}")
+            else:
+                output = client.files.content(batch.output_file_id)
+                by_id = {}
+                for line in output.text.splitlines():
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    body = (record.get('response') or {}).get('body') or {}
+                    choices = body.get('choices') or []
+                    if choices:
+                        by_id[record['custom_id']] = choices[0]['message']['content'].strip()
+                for i, prompt, cache_path in pending:
+                    result = by_id.get(str(i))
+                    if result is not None:
+                        results[i] = result
+                        if cache_path:
+                            self._write_cached_response(cache_path, result)
+
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"OpenAI batch error: {error_msg}")
+            check_api_error_and_exit(error_msg, "OpenAI Batch")
+
+        return [r if r is not None else "" for r in results]
+
+    def batch_enrich_descriptions(self):
+        """Refresh every product's listing description in one Batch API job
+
+        The bulk counterpart to the interactive pipeline: one description
+        prompt per product folder with a recipe.json sidecar, submitted
+        together through ask_gpt_batch at batch pricing, with each answer
+        written back into the folder's Listing.txt and listing.csv.
+        Returns the number of products updated.
+        """
+        try:
+            with os.scandir(PRODUCTS_DIR) as entries:
+                product_dirs = sorted(entry.path for entry in entries
+                                      if entry.is_dir(follow_symlinks=False))
+        except FileNotFoundError:
+            product_dirs = []
+
+        targets = []
+        prompts = []
+        for product_dir in product_dirs:
+            try:
+                with open(os.path.join(product_dir, "recipe.json"), 'r', encoding='utf-8') as f:
+                    recipe_data = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+            targets.append(product_dir)
+            prompts.append(self._description_prompt(recipe_data))
+
+        if not targets:
+            logger.warning("⚠️  No products with a recipe.json sidecar to enrich")
+            return 0
+
+        logger.info(f"📦 Submitting {len(targets)} description prompts as one batch")
+        responses = self.ask_gpt_batch(prompts, system=DESCRIBE_SYSTEM)
+
+        updated = 0
+        for product_dir, description in zip(targets, responses):
+            if not description:
+                logger.warning(f"⚠️  Batch returned no description for {os.path.basename(product_dir)}")
+                continue
+            self._write_refreshed_description(product_dir, description)
+            updated += 1
+
+        logger.info(f"✅ Refreshed descriptions for {updated} of {len(targets)} products")
+        return updated
+
+    @staticmethod
+    def _write_refreshed_description(product_dir, description):
+        """Swap a new description into a product's Listing.txt and listing.csv"""
+        listing_path = os.path.join(product_dir, "Listing.txt")
+        try:
+            with open(listing_path, 'r', encoding='utf-8') as f:
+                listing_text = f.read()
+            head, sep, tail = listing_text.partition("Description:\n")
+            if sep:
+                _, price_sep, price_tail = tail.partition("\n\nSuggested Price:")
+                new_tail = description + price_sep + price_tail if price_sep else description + "\n"
+                with open(listing_path, 'w', encoding='utf-8') as f:
+                    f.write(head + sep + new_tail)
+        except FileNotFoundError:
+            pass
+
+        csv_path = os.path.join(product_dir, "listing.csv")
+        try:
+            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+                rows = list(csv.reader(f))
+            if rows and 'Description' in rows[0]:
+                desc_col = rows[0].index('Description')
+                for row in rows[1:]:
+                    if len(row) > desc_col:
+                        row[desc_col] = description
+                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                    csv.writer(f).writerows(rows)
+        except FileNotFoundError:
+            pass
+
     def generate_image(self, prompt, output_path, size="1024x1024"):
         """Generate image using DALL-E"""
         try:
+            import requests
+
+            self.rate_limiter.wait_if_throttled()
             response = client.images.generate(
                 prompt=prompt,
                 n=1,
                 size=size
             )
-            
+            self.rate_limiter.record_success()
+
             image_url = response.data[0].url
             image_response = requests.get(image_url)
             image_response.raise_for_status()
-            
+
             with open(output_path, 'wb') as f:
                 f.write(image_response.content)
-            
+
             logger.info(f"🖼️  Image generated: {output_path}")
             return True
-            
+
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Image generation failed: {error_msg}")
-            
+            self._throttle_feedback(e, error_msg)
+
             # Check if this is a critical API error that should stop processing
             if check_api_error_and_exit(error_msg, "OpenAI DALL-E"):
                 return None  # Signal to calling function that processing should stop
             
             return False
     
+    def _normalize_ingredients(self, raw):
+        """Normalize parsed ingredient/instruction entries to plain strings
+
+        GPT sometimes returns ingredients as {"quantity": ..., "ingredient": ...}
+        dicts instead of plain strings. Flatten them once here so downstream
+        consumers never need their own stringify pass.
+        """
+        return [stringify_item(item) for item in raw or []]
+
     def parse_recipe_structure(self, ocr_text):
         """Parse OCR text into structured recipe data"""
         # If OCR text is very poor, create a generic recipe structure
         if len(ocr_text.strip()) < 30:
             return self.create_generic_recipe()
         
-        prompt = f"""
-        Parse this recipe text into a JSON structure. Extract:
-        - title: Recipe name (be specific and descriptive)
-        - ingredients: List of ingredients with quantities (each ingredient should be a complete string like "6 egg yolks", "3/4 c. dry farina (cereal)")
-        - instructions: Step-by-step cooking instructions
-        - servings: Number of servings (if mentioned)
-        - prep_time: Preparation time (if mentioned)
-        - cook_time: Cooking time (if mentioned)
-        
-        IMPORTANT: For ingredients, extract the COMPLETE ingredient line including quantity, unit, and ingredient name.
-        Do NOT separate quantity and ingredient name. Keep them together as one string per ingredient.
-        
-        Handle dual-part recipes (like cake + frosting) by separating them clearly.
-        Remove any personal names from the recipe.
-        
-        If the OCR text is unclear or too short, try to extract what you can and make reasonable assumptions.
-        If you can't determine specific ingredients, use common ingredients for the type of recipe.
-        
-        OCR Text:
-        {ocr_text}
-        
-        Return only valid JSON with ingredients as complete strings:
-        """
-        
-        response = self.ask_gpt(prompt)
-        
+        prompt = f"OCR Text:\n{ocr_text}"
+
+        response = self.ask_gpt(prompt, model=self.json_model, system=PARSE_SYSTEM, response_format=JSON_RESPONSE_FORMAT)
+
         # Check for API error signal
         if response is None:
             logger.error("🛑 Stopping recipe parsing due to API error")
             return None
-        
+
         try:
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
-                # Validate and clean the parsed data
-                if not parsed.get('title') or parsed['title'] == "Untitled Recipe":
-                    # Try to extract a better title from the OCR text
-                    lines = ocr_text.split('\n')
-                    for line in lines[:5]:  # Check first 5 lines
-                        line = line.strip()
-                        if line and len(line) > 3 and len(line) < 100:
-                            if not any(word in line.lower() for word in ['ingredients', 'instructions', 'directions', 'preheat']):
-                                parsed['title'] = line
-                                break
-                
-                # If still no good title, create one based on ingredients
-                if not parsed.get('title') or parsed['title'] == "Untitled Recipe":
-                    parsed['title'] = self.generate_recipe_title(parsed.get('ingredients', []))
-                
-                return parsed
-            else:
-                # Fallback parsing
-                return self.fallback_parse(ocr_text)
+            parsed = json.loads(response)
         except json.JSONDecodeError:
+            logger.warning(f"❌ Recipe parsing returned invalid JSON: {response[:100]}...")
             return self.fallback_parse(ocr_text)
+
+        # Validate and clean the parsed data
+        if not parsed.get('title') or parsed['title'] == "Untitled Recipe":
+            # Try to extract a better title from the OCR text
+            lines = ocr_text.split('\n')
+            for line in lines[:5]:  # Check first 5 lines
+                line = line.strip()
+                if line and len(line) > 3 and len(line) < 100:
+                    if not any(word in line.lower() for word in ['ingredients', 'instructions', 'directions', 'preheat']):
+                        parsed['title'] = line
+                        break
+
+        # If still no good title, create one based on ingredients
+        if not parsed.get('title') or parsed['title'] == "Untitled Recipe":
+            parsed['title'] = self.generate_recipe_title(parsed.get('ingredients', []))
+
+        # Normalize once so downstream consumers get plain strings
+        parsed['ingredients_norm'] = self._normalize_ingredients(parsed.get('ingredients'))
+        parsed['instructions'] = self._normalize_ingredients(parsed.get('instructions'))
+
+        return parsed
     
     def create_generic_recipe(self):
         """Create a generic recipe structure when OCR fails"""
-        return {
+        recipe = {
             "title": "Vintage Family Recipe",
             "ingredients": [
                 "2 cups all-purpose flour",
@@ -429,6 +1564,8 @@ class RecipeProcessor:
             "prep_time": "15 minutes",
             "cook_time": "12 minutes"
         }
+        recipe['ingredients_norm'] = list(recipe['ingredients'])
+        return recipe
     
     def generate_recipe_title(self, ingredients):
         """Generate a recipe title based on ingredients"""
@@ -508,51 +1645,30 @@ class RecipeProcessor:
         return {
             "title": title,
             "ingredients": ingredients,
+            "ingredients_norm": list(ingredients),
             "instructions": instructions,
             "servings": "Unknown",
             "prep_time": "Unknown",
             "cook_time": "Unknown"
         }
     
+    def _description_prompt(self, recipe_data):
+        """Build the listing-description prompt shared by the sync and batch paths"""
+        ingredients = recipe_data.get('ingredients_norm')
+        if ingredients is None:
+            ingredients = self._normalize_ingredients(recipe_data.get('ingredients'))
+        ingredients_text = ', '.join(ingredients[:5]) if ingredients else 'Traditional ingredients'
+
+        return f"""Recipe: {recipe_data['title']}
+Servings: {recipe_data.get('servings', 'Unknown')}
+Prep Time: {recipe_data.get('prep_time', 'Unknown')}
+Cook Time: {recipe_data.get('cook_time', 'Unknown')}
+Ingredients: {ingredients_text}
+Instructions: {len(recipe_data['instructions'])} steps"""
+
     def generate_recipe_description(self, recipe_data):
         """Generate enticing Etsy description"""
-        # Ensure ingredients are strings before joining
-        def stringify(item):
-            if isinstance(item, dict):
-                # Handle ingredient dictionaries with quantity and ingredient fields
-                if 'ingredient' in item and 'quantity' in item:
-                    return f"{item['quantity']} {item['ingredient']}"
-                elif 'ingredient' in item:
-                    return item['ingredient']
-                elif 'quantity' in item:
-                    return item['quantity']
-                else:
-                    # Try to get the first value
-                    return next(iter(item.values()), str(item))
-            return str(item)
-
-        ingredients = [stringify(ing) for ing in recipe_data.get('ingredients', [])]
-        ingredients_text = ', '.join(ingredients[:5]) if ingredients else 'Traditional ingredients'
-        
-        prompt = f"""
-        Create an enticing Etsy listing description for this vintage recipe. The description should:
-        - Be warm and nostalgic, mentioning family traditions and vintage cookbooks
-        - Describe the end result appealingly
-        - Mention it's a digital download
-        - Include suggested uses (gifting, printing, etc.)
-        - Be 2-3 paragraphs long
-        
-        Recipe: {recipe_data['title']}
-        Servings: {recipe_data.get('servings', 'Unknown')}
-        Prep Time: {recipe_data.get('prep_time', 'Unknown')}
-        Cook Time: {recipe_data.get('cook_time', 'Unknown')}
-        Ingredients: {ingredients_text}
-        Instructions: {len(recipe_data['instructions'])} steps
-        
-        Write a compelling description:
-        """
-        
-        response = self.ask_gpt(prompt)
+        response = self.ask_gpt(self._description_prompt(recipe_data), system=DESCRIBE_SYSTEM)
         
         # Check for API error signal
         if response is None:
@@ -564,124 +1680,53 @@ class RecipeProcessor:
         """Analyze ingredients for potential allergies"""
         if not ingredients:
             return {"allergens": []}
-        
-        # Ensure ingredients are strings
-        def stringify(item):
-            if isinstance(item, dict):
-                # Handle ingredient dictionaries with quantity and ingredient fields
-                if 'ingredient' in item and 'quantity' in item:
-                    return f"{item['quantity']} {item['ingredient']}"
-                elif 'ingredient' in item:
-                    return item['ingredient']
-                elif 'quantity' in item:
-                    return item['quantity']
-                else:
-                    # Try to get the first value
-                    return next(iter(item.values()), str(item))
-            return str(item)
 
-        ingredients_list = [stringify(ing) for ing in ingredients]
-        ingredients_text = ', '.join(ingredients_list)
-            
-        prompt = f"""
-        Analyze these ingredients for potential allergies. Return a JSON list of allergens:
-        {ingredients_text}
-        
-        Common allergens: gluten, dairy, eggs, nuts, soy, shellfish, fish, peanuts
-        Consider that "cake mix" contains gluten, "milk" contains dairy, etc.
-        
-        Return JSON: {{"allergens": ["allergen1", "allergen2"]}}
-        """
-        
-        response = self.ask_gpt(prompt)
-        
+        ingredients_text = ', '.join(ingredients)
+
+        prompt = f"Ingredients: {ingredients_text}"
+
+        response = self.ask_gpt(prompt, model=self.cheap_model, system=ALLERGY_SYSTEM, response_format=JSON_RESPONSE_FORMAT)
+
         # Check for API error signal
         if response is None:
             return None
-        
+
         try:
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            return {"allergens": []}
-        except:
+            return json.loads(response)
+        except json.JSONDecodeError:
+            logger.warning(f"❌ Allergy analysis returned invalid JSON: {response[:100]}...")
             return {"allergens": []}
     
     def analyze_diet_compatibility(self, ingredients, instructions):
         """Analyze recipe for diet compatibility"""
         if not ingredients:
             return {"diets": [], "not_compatible": []}
-        
-        # Ensure ingredients and instructions are strings
-        def stringify(item):
-            if isinstance(item, dict):
-                # Handle ingredient dictionaries with quantity and ingredient fields
-                if 'ingredient' in item and 'quantity' in item:
-                    return f"{item['quantity']} {item['ingredient']}"
-                elif 'ingredient' in item:
-                    return item['ingredient']
-                elif 'quantity' in item:
-                    return item['quantity']
-                else:
-                    # Try to get the first value
-                    return next(iter(item.values()), str(item))
-            return str(item)
-
-        ingredients_list = [stringify(ing) for ing in ingredients]
-        instructions_list = [stringify(inst) for inst in instructions]
-        ingredients_text = ', '.join(ingredients_list)
-        instructions_text = ' '.join(instructions_list)
-            
-        prompt = f"""
-        Analyze this recipe for diet compatibility. Return a JSON object:
-        
-        Ingredients: {ingredients_text}
-        Instructions: {instructions_text}
-        
-        Check for: vegan, vegetarian, gluten-free, dairy-free, paleo, keto, low-carb, nut-free
-        
-        Return JSON: {{"diets": ["diet1", "diet2"], "not_compatible": ["diet3"]}}
-        """
-        
-        response = self.ask_gpt(prompt)
-        
+
+        ingredients_text = ', '.join(ingredients)
+        instructions_text = ' '.join(instructions)
+
+        prompt = f"Ingredients: {ingredients_text}\nInstructions: {instructions_text}"
+
+        response = self.ask_gpt(prompt, model=self.cheap_model, system=DIET_SYSTEM, response_format=JSON_RESPONSE_FORMAT)
+
         # Check for API error signal
         if response is None:
             return None
-        
+
         try:
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            return {"diets": [], "not_compatible": []}
-        except:
+            return json.loads(response)
+        except json.JSONDecodeError:
+            logger.warning(f"❌ Diet analysis returned invalid JSON: {response[:100]}...")
             return {"diets": [], "not_compatible": []}
     
     def generate_nutrition_label(self, ingredients, instructions):
         """Generate nutrition information using USDA API"""
         if not ingredients:
             return {"calories": "Unknown", "fat": "Unknown", "carbs": "Unknown", "protein": "Unknown"}
-        
-        # Ensure ingredients are strings
-        def stringify(item):
-            if isinstance(item, dict):
-                # Handle ingredient dictionaries with quantity and ingredient fields
-                if 'ingredient' in item and 'quantity' in item:
-                    return f"{item['quantity']} {item['ingredient']}"
-                elif 'ingredient' in item:
-                    return item['ingredient']
-                elif 'quantity' in item:
-                    return item['quantity']
-                else:
-                    # Try to get the first value
-                    return next(iter(item.values()), str(item))
-            return str(item)
 
-        ingredients_list = [stringify(ing) for ing in ingredients]
-        
         try:
             # Use USDA API for accurate nutrition analysis
-            nutrition_data = usda_analyzer.analyze_recipe_nutrition(ingredients_list)
+            nutrition_data = usda_analyzer.analyze_recipe_nutrition(ingredients)
             
             # Format the results
             per_serving = nutrition_data['per_serving']
@@ -700,60 +1745,39 @@ class RecipeProcessor:
             logger.error(f"USDA nutrition analysis failed: {e}")
             
             # Fallback to LLM estimation
-            ingredients_text = ', '.join(ingredients_list)
-            instructions_list = [stringify(inst) for inst in instructions]
-            instructions_text = ' '.join(instructions_list)
-                
-            prompt = f"""
-            Estimate nutrition information for this recipe. Consider typical serving sizes.
-            
-            Ingredients: {ingredients_text}
-            Instructions: {instructions_text}
-            
-            Return JSON with estimated values per serving:
-            {{"calories": 300, "fat": "12g", "carbs": "45g", "protein": "5g", "fiber": "2g", "sugar": "25g", "sodium": "200mg"}}
-            """
-            
-            response = self.ask_gpt(prompt)
+            ingredients_text = ', '.join(ingredients)
+            instructions_text = ' '.join(instructions)
+
+            prompt = f"Ingredients: {ingredients_text}\nInstructions: {instructions_text}"
+
+            response = self.ask_gpt(prompt, model=self.json_model, system=NUTRITION_SYSTEM, response_format=JSON_RESPONSE_FORMAT)
             try:
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
-                return {"calories": "Unknown", "fat": "Unknown", "carbs": "Unknown", "protein": "Unknown"}
-            except:
+                return json.loads(response)
+            except (TypeError, json.JSONDecodeError):
+                logger.warning("❌ Nutrition estimation returned invalid JSON")
                 return {"calories": "Unknown", "fat": "Unknown", "carbs": "Unknown", "protein": "Unknown"}
     
     def generate_social_content(self, recipe_data, description):
         """Generate social media content"""
         # Instagram post
-        instagram_prompt = f"""
-        Create an Instagram post for this recipe. Include:
-        - Engaging opening with emojis
-        - Brief description
-        - Call to action
-        - Relevant hashtags
-        
-        Recipe: {recipe_data['title']}
-        Description: {description[:200]}...
-        
-        Format with emojis and hashtags.
-        """
-        
-        instagram_content = self.ask_gpt(instagram_prompt)
+        instagram_prompt = INSTAGRAM_PROMPT_TMPL.format_map({
+            'title': recipe_data['title'],
+            'description': description[:200]
+        })
+
+        instagram_content = self.ask_gpt(instagram_prompt, semantic=True)
         
         # Check for API error signal
         if instagram_content is None:
             return None
         
         # Pinterest description
-        pinterest_prompt = f"""
-        Create a Pinterest description for this recipe. Keep it under 500 characters.
-        
-        Recipe: {recipe_data['title']}
-        Description: {description[:100]}...
-        """
-        
-        pinterest_content = self.ask_gpt(pinterest_prompt)
+        pinterest_prompt = PINTEREST_PROMPT_TMPL.format_map({
+            'title': recipe_data['title'],
+            'description': description[:100]
+        })
+
+        pinterest_content = self.ask_gpt(pinterest_prompt, model=self.cheap_model, semantic=True)
         
         # Check for API error signal
         if pinterest_content is None:
@@ -764,128 +1788,116 @@ class RecipeProcessor:
             "pinterest": pinterest_content
         }
     
-    def estimate_recipe_details(self, recipe_data):
-        """Estimate servings, prep time, and cook time using AI"""
-        # Ensure ingredients and instructions are strings
-        def stringify(item):
-            if isinstance(item, dict):
-                if 'ingredient' in item and 'quantity' in item:
-                    return f"{item['quantity']} {item['ingredient']}"
-                elif 'ingredient' in item:
-                    return item['ingredient']
-                elif 'quantity' in item:
-                    return item['quantity']
-                else:
-                    return next(iter(item.values()), str(item))
-            return str(item)
+    def generate_all_content_batch(self, recipe_data):
+        """Generate all per-recipe text content in a single structured GPT call
 
-        ingredients = [stringify(ing) for ing in recipe_data.get('ingredients', [])]
-        instructions = [stringify(inst) for inst in recipe_data.get('instructions', [])]
-        
-        prompt = f"""
-        Analyze this recipe and estimate the missing details. Return only a JSON object with these fields:
-        - servings: Number of servings (e.g., "6 servings", "24 cookies", "1 loaf")
-        - prep_time: Preparation time (e.g., "15 minutes", "30 minutes")
-        - cook_time: Cooking/baking time (e.g., "45 minutes", "1 hour", "12-15 minutes")
-        
-        Recipe: {recipe_data['title']}
-        Ingredients: {', '.join(ingredients)}
-        Instructions: {' '.join(instructions)}
-        
-        Consider:
-        - Recipe type (cookies, cake, bread, etc.)
-        - Ingredient quantities
-        - Number of steps
-        - Typical cooking methods mentioned
-        
-        IMPORTANT: Always use standardized formats:
-        - servings: Use "X servings" for general recipes, "X cookies/bars" for cookies, "1 loaf/cake" for breads/cakes
-        - prep_time: Always include "minutes" or "hours" (e.g., "20 minutes", "1 hour")
-        - cook_time: Always include "minutes" or "hours" (e.g., "45 minutes", "1 hour")
-        
-        Return only valid JSON: {{"servings": "X servings", "prep_time": "X minutes", "cook_time": "X minutes"}}
+        Collapses the description/allergy/diet/social/tags/estimate round-trips
+        into one request. Returns a dict of fields on success, an empty dict
+        when the response can't be used (callers fall back to the sequential
+        per-field calls), or None on a critical API error.
+        """
+        ingredients = recipe_data.get('ingredients_norm', [])
+        instructions = recipe_data.get('instructions', [])
+
+        prompt = f"""Recipe: {recipe_data['title']}
+Servings: {recipe_data.get('servings', 'Unknown')}
+Prep Time: {recipe_data.get('prep_time', 'Unknown')}
+Cook Time: {recipe_data.get('cook_time', 'Unknown')}
+Ingredients: {', '.join(ingredients)}
+Instructions: {' '.join(instructions)}"""
+
+        response = self.ask_gpt(prompt, model=self.json_model, system=BATCH_CONTENT_SYSTEM, response_format=JSON_RESPONSE_FORMAT)
+
+        # Check for API error signal
+        if response is None:
+            return None
+
+        try:
+            batch = json.loads(response.strip().strip('`'))
+        except json.JSONDecodeError:
+            logger.warning("❌ Batched content response was not valid JSON, falling back to sequential calls")
+            return {}
+
+        # Every key the prompt demands, including the detail estimates —
+        # a reply without servings/prep_time/cook_time must fall back so
+        # estimate_recipe_details still runs for those fields
+        required = ('description', 'allergens', 'diets', 'instagram', 'pinterest',
+                    'tags', 'servings', 'prep_time', 'cook_time')
+        if not all(key in batch for key in required):
+            logger.warning("❌ Batched content response missing fields, falling back to sequential calls")
+            return {}
+
+        # Tags occasionally come back as one comma-separated string
+        if isinstance(batch['tags'], str):
+            batch['tags'] = [tag.strip() for tag in batch['tags'].split(',')]
+
+        logger.info("✅ Generated all recipe content in a single batched call")
+        return batch
+
+    def estimate_details_from_title(self, title):
+        """Keyword-based detail estimates for common recipe types
+
+        Returns None when the title matches no known type. One tokenization
+        plus O(1) lookups per keyword replaces the old chain of substring
+        scans over the whole title.
         """
-        
-        response = self.ask_gpt(prompt)
-        logger.info(f"🤖 AI estimation response: {response[:200]}...")
-        
+        tokens = set(title.lower().split())
+
+        for keyword, estimates in RECIPE_TYPE_ESTIMATES.items():
+            if keyword in tokens:
+                return dict(estimates)
+
+        return None
+
+    def estimate_recipe_details(self, recipe_data):
+        """Estimate servings, prep time, and cook time using AI"""
+        # Known recipe types resolve from the title alone - skip the LLM call
+        estimated = self.estimate_details_from_title(recipe_data['title'])
+        if estimated:
+            logger.info(f"📊 Estimated details from recipe type: {estimated}")
+            return estimated
+
+        # Ensure ingredients and instructions are strings
+        ingredients = [stringify_item(ing) for ing in recipe_data.get('ingredients', [])]
+        instructions = [stringify_item(inst) for inst in recipe_data.get('instructions', [])]
+        
+        prompt = ESTIMATE_PROMPT_TMPL.format_map({
+            'title': recipe_data['title'],
+            'ingredients': self._cap_tokens(', '.join(ingredients), 400),
+            'instructions': self._cap_tokens(' '.join(instructions), 800)
+        })
+
+        response = self.ask_gpt(prompt, model=self.cheap_model, response_format=JSON_RESPONSE_FORMAT)
+
         # Check for API error signal
         if response is None:
             return None
-        
+
+        logger.info(f"🤖 AI estimation response: {response[:200]}...")
+
         try:
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                estimated = json.loads(json_match.group())
-                logger.info(f"✅ AI estimation successful: {estimated}")
-                return estimated
-            else:
-                logger.warning("❌ No JSON found in AI estimation response")
-        except Exception as e:
+            estimated = json.loads(response)
+            logger.info(f"✅ AI estimation successful: {estimated}")
+            return estimated
+        except json.JSONDecodeError as e:
             logger.error(f"❌ JSON parsing failed for AI estimation: {e}")
         
-        # Fallback estimates based on recipe type
-        logger.info("🔄 Using fallback estimates based on recipe type")
-        
-        # Analyze recipe title and ingredients to determine type
-        title_lower = recipe_data['title'].lower()
-        ingredients_text = ' '.join(ingredients).lower()
-        
-        # Determine recipe type for better fallback estimates
-        if any(word in title_lower for word in ['cookie', 'cookies']):
-            return {
-                "servings": "24 cookies",
-                "prep_time": "15 minutes", 
-                "cook_time": "12 minutes"
-            }
-        elif any(word in title_lower for word in ['cake', 'bread']):
-            return {
-                "servings": "8 servings",
-                "prep_time": "20 minutes", 
-                "cook_time": "45 minutes"
-            }
-        elif any(word in title_lower for word in ['pie', 'tart']):
-            return {
-                "servings": "8 servings",
-                "prep_time": "30 minutes", 
-                "cook_time": "1 hour"
-            }
-        elif any(word in title_lower for word in ['brownie', 'brownies']):
-            return {
-                "servings": "16 brownies",
-                "prep_time": "15 minutes", 
-                "cook_time": "25 minutes"
-            }
-        elif any(word in title_lower for word in ['bar', 'bars']):
-            return {
-                "servings": "16 bars",
-                "prep_time": "15 minutes", 
-                "cook_time": "25 minutes"
-            }
-        else:
-            # Default fallback
-            return {
-                "servings": "8 servings",
-                "prep_time": "20 minutes", 
-                "cook_time": "30 minutes"
-            }
+        # Default fallback when the LLM can't help either
+        logger.info("🔄 Using default estimates")
+        return {
+            "servings": "8 servings",
+            "prep_time": "20 minutes",
+            "cook_time": "30 minutes"
+        }
 
     def generate_tags(self, recipe_data, description):
         """Generate Etsy tags"""
-        prompt = f"""
-        Generate 13 relevant Etsy tags for this recipe listing. Include:
-        - Recipe type
-        - Vintage/retro themes
-        - Digital download
-        - Cooking/baking terms
-        
-        Recipe: {recipe_data['title']}
-        Description: {description[:200]}...
-        
-        Return as comma-separated list.
-        """
-        
-        response = self.ask_gpt(prompt)
+        prompt = TAGS_PROMPT_TMPL.format_map({
+            'title': recipe_data['title'],
+            'description': description[:200]
+        })
+
+        response = self.ask_gpt(prompt, model=self.cheap_model, semantic=True)
         
         # Check for API error signal
         if response is None:
@@ -896,78 +1908,40 @@ class RecipeProcessor:
     
     def create_recipe_pdf(self, recipe_data, nutrition, output_path):
         """Create beautiful recipe PDF"""
-        try:
-            doc = SimpleDocTemplate(output_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Ensure ingredients and instructions are strings
-            def stringify(item):
-                if isinstance(item, dict):
-                    # Handle ingredient dictionaries with quantity and ingredient fields
-                    if 'ingredient' in item and 'quantity' in item:
-                        return f"{item['quantity']} {item['ingredient']}"
-                    elif 'ingredient' in item:
-                        return item['ingredient']
-                    elif 'quantity' in item:
-                        return item['quantity']
-                    else:
-                        # Try to get the first value
-                        return next(iter(item.values()), str(item))
-                return str(item)
-
-            ingredients = [stringify(ing) for ing in recipe_data.get('ingredients', [])]
-            instructions = [stringify(inst) for inst in recipe_data.get('instructions', [])]
-            
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=1  # Center
-            )
-            story.append(Paragraph(recipe_data['title'], title_style))
-            story.append(Spacer(1, 20))
-            
-            # Recipe details
-            details_text = f"Servings: {recipe_data.get('servings', 'Unknown')} | Prep Time: {recipe_data.get('prep_time', 'Unknown')} | Cook Time: {recipe_data.get('cook_time', 'Unknown')}"
-            story.append(Paragraph(details_text, styles['Normal']))
-            story.append(Spacer(1, 20))
-            
-            # Ingredients
-            story.append(Paragraph("Ingredients", styles['Heading2']))
-            for ingredient in ingredients:
-                story.append(Paragraph(f"• {ingredient}", styles['Normal']))
-            story.append(Spacer(1, 20))
-            
-            # Instructions
-            story.append(Paragraph("Instructions", styles['Heading2']))
-            for i, instruction in enumerate(instructions, 1):
-                story.append(Paragraph(f"{i}. {instruction}", styles['Normal']))
-            story.append(Spacer(1, 20))
-            
-            # Nutrition info
-            if nutrition.get('calories') != "Unknown":
-                story.append(Paragraph("Nutrition Information (per serving)", styles['Heading2']))
-                nutrition_text = f"Calories: {nutrition.get('calories', 'Unknown')} | Fat: {nutrition.get('fat', 'Unknown')} | Carbs: {nutrition.get('carbs', 'Unknown')} | Protein: {nutrition.get('protein', 'Unknown')}"
-                if nutrition.get('fiber') != "Unknown":
-                    nutrition_text += f" | Fiber: {nutrition.get('fiber', 'Unknown')}"
-                if nutrition.get('sugar') != "Unknown":
-                    nutrition_text += f" | Sugar: {nutrition.get('sugar', 'Unknown')}"
-                if nutrition.get('sodium') != "Unknown":
-                    nutrition_text += f" | Sodium: {nutrition.get('sodium', 'Unknown')}"
-                story.append(Paragraph(nutrition_text, styles['Normal']))
-                story.append(Spacer(1, 20))
-            
+        render_recipe_pdf(recipe_data, nutrition, output_path)
+
+    def _get_pdf_pool(self):
+        """Lazily create the process pool shared by all PDF renders in a run
+
+        PDF rendering is CPU-bound, so worker processes (not threads) let
+        batch runs use every core for the render phase. Creation is
+        locked: recipe threads race here on the first render, and two
+        unsynchronized winners would each create a full-size pool and
+        leak one of them. The pool uses the spawn start method because it
+        is created while the other recipe threads are live - forking a
+        multithreaded parent can snapshot locks (logging's, for one) held
+        mid-operation and deadlock the child.
+        """
+        if self._pdf_pool is None:
+            with self._state_lock:
+                if self._pdf_pool is None:
+                    import multiprocessing
+                    from concurrent.futures import ProcessPoolExecutor
+                    self._pdf_pool = ProcessPoolExecutor(
+                        max_workers=os.cpu_count(),
+                        mp_context=multiprocessing.get_context('spawn'))
+        return self._pdf_pool
+
+    def _record_processed(self):
+        """Count a success; locked because recipe threads finish concurrently"""
+        with self._state_lock:
+            self.processed_count += 1
+
+    def _record_failed(self):
+        """Count a failure; locked because recipe threads finish concurrently"""
+        with self._state_lock:
+            self.failed_count += 1
 
-            
-            doc.build(story)
-            logger.info(f"📄 PDF created: {output_path}")
-            
-        except Exception as e:
-            logger.error(f"PDF creation error: {e}")
-    
     def create_product_folder(self, recipe_data, image_path):
         """Create product folder and organize files"""
         slug = self.slugify(recipe_data['title'])
@@ -975,81 +1949,54 @@ class RecipeProcessor:
         product_dir = os.path.join(PRODUCTS_DIR, unique_id)
         os.makedirs(product_dir, exist_ok=True)
         
-        # Move original image
+        # Keep the original image alongside the product files. The source is
+        # never edited in place, so a hard link avoids copying the bytes at
+        # all; fall back to a plain copy across filesystems
         dest_image_path = os.path.join(product_dir, f"original-{os.path.basename(image_path)}")
-        shutil.copy2(image_path, dest_image_path)
-        
+        try:
+            os.link(image_path, dest_image_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copyfile(image_path, dest_image_path)
+
+        # Keep the original-image lookup current for image-only regen runs
+        if self._original_to_product is not None:
+            self._original_to_product[os.path.basename(image_path)] = product_dir
+
         return product_dir, slug, unique_id
     
     def generate_coordinated_image_prompts(self, recipe_data):
         """Use AI to analyze recipe and generate coordinated image prompts"""
         
         # Ensure ingredients and instructions are strings
-        def stringify(item):
-            if isinstance(item, dict):
-                if 'ingredient' in item and 'quantity' in item:
-                    return f"{item['quantity']} {item['ingredient']}"
-                elif 'ingredient' in item:
-                    return item['ingredient']
-                elif 'quantity' in item:
-                    return item['quantity']
-                else:
-                    return next(iter(item.values()), str(item))
-            return str(item)
-
-        ingredients = [stringify(ing) for ing in recipe_data.get('ingredients', [])]
-        instructions = [stringify(inst) for inst in recipe_data.get('instructions', [])]
+        ingredients = [stringify_item(ing) for ing in recipe_data.get('ingredients', [])]
+        instructions = [stringify_item(inst) for inst in recipe_data.get('instructions', [])]
         
         # Give AI the full recipe context
-        prompt = f"""
-        Analyze this recipe and create two coordinated image prompts for professional food photography.
-        
-        Recipe Title: {recipe_data['title']}
-        Servings: {recipe_data.get('servings', 'Unknown')}
-        Prep Time: {recipe_data.get('prep_time', 'Unknown')}
-        Cook Time: {recipe_data.get('cook_time', 'Unknown')}
-        
-        Ingredients:
-        {chr(10).join([f"- {ingredient}" for ingredient in ingredients])}
-        
-        Instructions:
-        {chr(10).join([f"{i+1}. {instruction}" for i, instruction in enumerate(instructions)])}
-        
-        Create two coordinated image prompts:
-        
-        1. MAIN IMAGE (finished product): Professional food photography of the complete recipe fresh out of the oven
-        2. SERVING IMAGE (individual portion): Close-up of a single serving that visually matches the main image
-        
-        Both images should:
-        - Have consistent styling, lighting, and aesthetic
-        - Show the same recipe with the same visual characteristics
-        - Use vintage/rustic presentation
-        - Be high quality with no text or watermarks
-        - Include specific visual details based on the recipe ingredients and cooking method
-        
-        Return as JSON:
-        {{
-            "main_image": "detailed prompt for main image",
-            "serving_image": "detailed prompt for serving image"
-        }}
-        """
-        
-        response = self.ask_gpt(prompt)
-        logger.info(f"🤖 AI image prompt generation response: {response[:200]}...")
-        
+        prompt = IMAGE_PROMPTS_TMPL.format_map({
+            'title': recipe_data['title'],
+            'servings': recipe_data.get('servings', 'Unknown'),
+            'prep_time': recipe_data.get('prep_time', 'Unknown'),
+            'cook_time': recipe_data.get('cook_time', 'Unknown'),
+            'ingredients': self._cap_tokens('\n'.join(f"- {ingredient}" for ingredient in ingredients), 400),
+            'instructions': self._cap_tokens('\n'.join(f"{i+1}. {instruction}" for i, instruction in enumerate(instructions)), 800)
+        })
+
+
+        response = self.ask_gpt(prompt, model=self.json_model, response_format=JSON_RESPONSE_FORMAT)
+
         # Check for API error signal
         if response is None:
             return None, None
-        
+
+        logger.info(f"🤖 AI image prompt generation response: {response[:200]}...")
+
         try:
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                prompts = json.loads(json_match.group())
-                logger.info(f"✅ AI-generated coordinated prompts successfully")
-                return prompts['main_image'], prompts['serving_image']
-            else:
-                logger.warning("❌ No JSON found in AI image prompt response")
-        except Exception as e:
+            prompts = json.loads(response)
+            logger.info(f"✅ AI-generated coordinated prompts successfully")
+            return prompts['main_image'], prompts['serving_image']
+        except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"❌ JSON parsing failed for AI image prompts: {e}")
         
         # Fallback to basic prompts
@@ -1084,22 +2031,21 @@ class RecipeProcessor:
             
             logger.info(f"🎨 AI-generated main image prompt: {main_prompt[:100]}...")
             logger.info(f"🎨 AI-generated serving image prompt: {serving_prompt[:100]}...")
-            
-            # Generate main image
+
+            # Generate both images concurrently - DALL-E calls are the slowest
+            # single operation (often 10-30s each), so running them in parallel
+            # halves the image wall time per recipe
             finished_image_path = os.path.join(product_dir, "image-main.png")
-            success1 = self.generate_image(main_prompt, finished_image_path)
-            
-            # Check for API error signal
-            if success1 is None:
-                logger.error("🛑 Stopping image generation due to API error")
-                return None
-            
-            # Generate serving image
             serving_image_path = os.path.join(product_dir, "image-served.png")
-            success2 = self.generate_image(serving_prompt, serving_image_path)
-            
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                main_future = pool.submit(self.generate_image, main_prompt, finished_image_path)
+                serving_future = pool.submit(self.generate_image, serving_prompt, serving_image_path)
+                success1 = main_future.result()
+                success2 = serving_future.result()
+
             # Check for API error signal
-            if success2 is None:
+            if success1 is None or success2 is None:
                 logger.error("🛑 Stopping image generation due to API error")
                 return None
             
@@ -1124,25 +2070,11 @@ class RecipeProcessor:
         """Save all content files to product directory"""
         
         # Ensure ingredients and instructions are lists of strings
-        def stringify(item):
-            if isinstance(item, dict):
-                # Handle ingredient dictionaries with quantity and ingredient fields
-                if 'ingredient' in item and 'quantity' in item:
-                    return f"{item['quantity']} {item['ingredient']}"
-                elif 'ingredient' in item:
-                    return item['ingredient']
-                elif 'quantity' in item:
-                    return item['quantity']
-                else:
-                    # Try to get the first value
-                    return next(iter(item.values()), str(item))
-            return str(item)
-
-        ingredients = [stringify(ing) for ing in recipe_data.get('ingredients', [])]
+        ingredients = [stringify_item(ing) for ing in recipe_data.get('ingredients', [])]
         if not ingredients:
             ingredients = ["Traditional ingredients"]
             
-        instructions = [stringify(inst) for inst in recipe_data.get('instructions', [])]
+        instructions = [stringify_item(inst) for inst in recipe_data.get('instructions', [])]
         if not instructions:
             instructions = ["Follow traditional baking methods"]
         
@@ -1172,9 +2104,6 @@ Allergies: {', '.join(allergies.get('allergens', []))}
 Diet Compatibility: {', '.join(diet_info.get('diets', []))}
 """
         
-        with open(os.path.join(product_dir, "Recipe.txt"), "w") as f:
-            f.write(recipe_text)
-        
         # Listing description
         listing_text = f"""Title:
 {recipe_data['title']} | Digital Recipe Download
@@ -1192,31 +2121,47 @@ Description:
 Suggested Price: $4.99
 """
         
-        with open(os.path.join(product_dir, "Listing.txt"), "w") as f:
-            f.write(listing_text)
-        
-        # Social media content
-        with open(os.path.join(product_dir, "Instagram.txt"), "w") as f:
-            f.write(social_content['instagram'])
-        
-        with open(os.path.join(product_dir, "Pinterest.txt"), "w") as f:
-            f.write(social_content['pinterest'])
-        
-        # CSV for Etsy import
-        csv_data = {
-            'Title': f"{recipe_data['title']} | Digital Recipe Download",
-            'Description': description,
-            'Price': '4.99',
-            'Currency Code': 'USD',
-            'Quantity': '100',
-            'Tags': ', '.join(tags)
+        # CSV for Etsy import, rendered in memory alongside the other files
+        from io import StringIO
+
+        csv_buffer = StringIO()
+        writer = csv.writer(csv_buffer)
+        writer.writerow(['Title', 'Description', 'Price', 'Currency Code', 'Quantity', 'Tags'])
+        writer.writerow([
+            f"{recipe_data['title']} | Digital Recipe Download",
+            description,
+            '4.99',
+            'USD',
+            '100',
+            ', '.join(tags)
+        ])
+
+        # Canonical machine-readable sidecar: later image-only runs load
+        # this with one json.loads instead of re-parsing Recipe.txt line by
+        # line (Recipe.txt stays the human/print artifact)
+        recipe_json = json.dumps({
+            'title': recipe_data['title'],
+            'ingredients': ingredients,
+            'instructions': instructions,
+            'servings': recipe_data.get('servings', 'Unknown'),
+            'prep_time': recipe_data.get('prep_time', 'Unknown'),
+            'cook_time': recipe_data.get('cook_time', 'Unknown')
+        })
+
+        # All content is precomputed above, so the writes collapse into one loop
+        files = {
+            "Recipe.txt": recipe_text,
+            "recipe.json": recipe_json,
+            "Listing.txt": listing_text,
+            "Instagram.txt": social_content['instagram'],
+            "Pinterest.txt": social_content['pinterest'],
+            "listing.csv": csv_buffer.getvalue()
         }
-        
-        with open(os.path.join(product_dir, "listing.csv"), "w", newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_data.keys())
-            writer.writeheader()
-            writer.writerow(csv_data)
-        
+
+        for filename, content in files.items():
+            with open(os.path.join(product_dir, filename), "w", newline='', encoding='utf-8') as f:
+                f.write(content)
+
         logger.info(f"📁 Content files saved to {product_dir}")
     
     def process_single_recipe(self, image_path, generate_images=False, force_reprocess=False):
@@ -1262,17 +2207,72 @@ Suggested Price: $4.99
             
             # Debug: Log parsed recipe data
             logger.info(f"📋 Parsed recipe: {recipe_data['title']} - {len(recipe_data.get('ingredients', []))} ingredients, {len(recipe_data.get('instructions', []))} instructions")
-            
+
+            # Content-level dedup: if another scan already produced identical
+            # recipe data, copy its finished product folder instead of paying
+            # for the whole content/PDF/image pipeline again
+            content_id = self.recipe_content_id(recipe_data)
+            existing_dir = self.recipe_index.get(content_id)
+            if existing_dir and os.path.isdir(existing_dir) and not force_reprocess:
+                slug = self.slugify(recipe_data['title'])
+                unique_id = f"{slug}-{self.random_hash()}"
+                product_dir = os.path.join(PRODUCTS_DIR, unique_id)
+                shutil.copytree(existing_dir, product_dir)
+
+                # The clone carries the source scan's original-* file; swap
+                # in this scan's original so the image-only regen lookup can
+                # map this image to its product dir, and note whether the
+                # source recipe already had product images generated
+                image_name = os.path.basename(image_path)
+                source_images_generated = False
+                with os.scandir(product_dir) as entries:
+                    stale_originals = [entry.name for entry in entries
+                                       if entry.name.startswith('original-')]
+                for name in stale_originals:
+                    source_entry = self.processed_images.get(name[len('original-'):], {})
+                    source_images_generated = source_images_generated or bool(source_entry.get('images_generated'))
+                    os.remove(os.path.join(product_dir, name))
+
+                dest_image_path = os.path.join(product_dir, f"original-{image_name}")
+                try:
+                    os.link(image_path, dest_image_path)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    shutil.copyfile(image_path, dest_image_path)
+                if self._original_to_product is not None:
+                    self._original_to_product[image_name] = product_dir
+
+                logger.info(f"♻️  Duplicate recipe content - reused artifacts from {os.path.basename(existing_dir)}")
+                self.mark_image_processed(image_path, recipe_data['title'], success=True,
+                                          images_generated=source_images_generated)
+                self._record_processed()
+                return True
+
             # Create product folder
             product_dir, slug, unique_id = self.create_product_folder(recipe_data, image_path)
             
-            # Estimate missing recipe details
-            estimated_details = self.estimate_recipe_details(recipe_data)
-            
-            # Check for API error signal
-            if estimated_details is None:
+            # Generate all text content (description, allergies, diet, social,
+            # tags, detail estimates) in one batched call when possible
+            batch = self.generate_all_content_batch(recipe_data)
+            if batch is None:
                 logger.error("🛑 Stopping processing due to API error")
                 return None
+
+            # Estimate missing recipe details
+            if batch:
+                estimated_details = {
+                    'servings': batch.get('servings', 'Unknown'),
+                    'prep_time': batch.get('prep_time', 'Unknown'),
+                    'cook_time': batch.get('cook_time', 'Unknown')
+                }
+            else:
+                estimated_details = self.estimate_recipe_details(recipe_data)
+
+                # Check for API error signal
+                if estimated_details is None:
+                    logger.error("🛑 Stopping processing due to API error")
+                    return None
             
             # Merge estimated details with original data
             # Use estimated values if original values are missing, None, or "Unknown"
@@ -1288,29 +2288,19 @@ Suggested Price: $4.99
                     value_str = str(value).strip().lower()
                     
                     # Check for common "unknown" or empty patterns
-                    unknown_patterns = [
-                        'unknown', 'not mentioned', 'n/a', 'none', 'unspecified',
-                        'not specified', 'not given', 'missing', 'blank', '',
-                        'null', 'undefined', 'tbd', 'to be determined'
-                    ]
-                    
-                    if value_str in unknown_patterns:
+                    if value_str in UNKNOWN_VALUE_PATTERNS:
                         return False
                     
                     # Check if it contains meaningful content (numbers, units, descriptive words)
                     # For servings: should contain numbers or descriptive words like "servings", "cookies", "loaf"
                     # For times: should contain numbers and time units
                     if field_name == 'servings':
-                        # Check for numbers or descriptive serving terms
-                        has_numbers = any(char.isdigit() for char in value_str)
-                        has_serving_terms = any(term in value_str for term in ['serving', 'cookie', 'slice', 'piece', 'loaf', 'cake', 'bar', 'cup', 'portion'])
-                        return has_numbers or has_serving_terms
-                    
+                        # Numbers or descriptive serving terms
+                        return _SERVING_TERMS_RE.search(value_str) is not None
+
                     elif field_name in ['prep_time', 'cook_time']:
-                        # Check for numbers and time units
-                        has_numbers = any(char.isdigit() for char in value_str)
-                        has_time_units = any(unit in value_str for unit in ['minute', 'hour', 'second', 'min', 'hr', 'sec'])
-                        return has_numbers and has_time_units
+                        # Needs both a number and a time unit
+                        return bool(_DIGIT_RE.search(value_str)) and bool(_TIME_UNITS_RE.search(value_str))
                     
                     # Default: if it's not obviously "unknown", consider it meaningful
                     return True
@@ -1338,59 +2328,73 @@ Suggested Price: $4.99
                 'cook_time'
             )
             
-            # Generate content
-            description = self.generate_recipe_description(recipe_data)
-            if description is None:
-                logger.error("🛑 Stopping processing due to API error")
-                return None
-            
-            allergies = self.analyze_allergies(recipe_data.get('ingredients', []))
-            if allergies is None:
-                logger.error("🛑 Stopping processing due to API error")
-                return None
-            
-            diet_info = self.analyze_diet_compatibility(recipe_data.get('ingredients', []), recipe_data.get('instructions', []))
-            if diet_info is None:
-                logger.error("🛑 Stopping processing due to API error")
-                return None
-            
-            nutrition = self.generate_nutrition_label(recipe_data.get('ingredients', []), recipe_data.get('instructions', []))
+            # Generate content (from the batched call, or field by field)
+            if batch:
+                description = batch['description']
+                allergies = {'allergens': batch.get('allergens', [])}
+                diet_info = {'diets': batch.get('diets', []), 'not_compatible': batch.get('not_compatible', [])}
+                social_content = {'instagram': batch['instagram'], 'pinterest': batch['pinterest']}
+                tags = [str(tag).strip() for tag in batch['tags']][:13]
+            else:
+                # The per-field calls have no data dependency on each other
+                # (social and tags only need the description), so dispatch
+                # them concurrently instead of paying each round-trip serially
+                with ThreadPoolExecutor(max_workers=3) as pool:
+                    description_future = pool.submit(self.generate_recipe_description, recipe_data)
+                    allergies_future = pool.submit(self.analyze_allergies, recipe_data.get('ingredients_norm', []))
+                    diet_future = pool.submit(self.analyze_diet_compatibility, recipe_data.get('ingredients_norm', []), recipe_data.get('instructions', []))
+
+                    description = description_future.result()
+                    if description is None:
+                        logger.error("🛑 Stopping processing due to API error")
+                        return None
+
+                    social_future = pool.submit(self.generate_social_content, recipe_data, description)
+                    tags_future = pool.submit(self.generate_tags, recipe_data, description)
+
+                    allergies = allergies_future.result()
+                    diet_info = diet_future.result()
+                    social_content = social_future.result()
+                    tags = tags_future.result()
+
+                if allergies is None or diet_info is None or social_content is None or tags is None:
+                    logger.error("🛑 Stopping processing due to API error")
+                    return None
+
+            # Nutrition comes from the USDA analyzer, not the LLM, so it is
+            # not part of the batched call
+            nutrition = self.generate_nutrition_label(recipe_data.get('ingredients_norm', []), recipe_data.get('instructions', []))
             if nutrition is None:
                 logger.error("🛑 Stopping processing due to API error")
                 return None
             
-            social_content = self.generate_social_content(recipe_data, description)
-            if social_content is None:
-                logger.error("🛑 Stopping processing due to API error")
-                return None
-            
-            tags = self.generate_tags(recipe_data, description)
-            if tags is None:
-                logger.error("🛑 Stopping processing due to API error")
-                return None
-            
             # Save content files
             self.save_content_files(product_dir, recipe_data, description, social_content, tags, nutrition, allergies, diet_info)
             
-            # Create PDFs
+            # Create PDFs - the plain card renders in a worker process while
+            # the fancy card builds here
             pdf_path = os.path.join(product_dir, f"{slug}_Recipe-Card.pdf")
-            self.create_recipe_pdf(recipe_data, nutrition, pdf_path)
-            
+            pdf_future = self._get_pdf_pool().submit(render_recipe_pdf, recipe_data, nutrition, pdf_path)
+
             # Check if we have generated images to include in fancy PDF
+            # One directory scan instead of a stat call per candidate image
+            with os.scandir(product_dir) as entries:
+                existing_names = {entry.name for entry in entries}
+
             image_paths = []
-            main_image_path = os.path.join(product_dir, "image-main.png")
-            serving_image_path = os.path.join(product_dir, "image-served.png")
-            
-            if os.path.exists(main_image_path):
-                image_paths.append(main_image_path)
-            if os.path.exists(serving_image_path):
-                image_paths.append(serving_image_path)
+            if "image-main.png" in existing_names:
+                image_paths.append(os.path.join(product_dir, "image-main.png"))
+            if "image-served.png" in existing_names:
+                image_paths.append(os.path.join(product_dir, "image-served.png"))
             
             fancy_pdf_path = os.path.join(product_dir, f"{slug}_Recipe-Card-fancy.pdf")
             if image_paths:
                 self.create_fancy_recipe_pdf_with_images(recipe_data, nutrition, fancy_pdf_path, image_paths)
             else:
                 self.create_fancy_recipe_pdf(recipe_data, nutrition, fancy_pdf_path)
+
+            # Wait for the worker-process render before marking success
+            pdf_future.result()
             
             # Generate product images (only if requested)
             if generate_images:
@@ -1403,14 +2407,20 @@ Suggested Price: $4.99
                 logger.info(f"🖼️  Skipping image generation (use --generate-images to enable)")
             
             logger.info(f"✅ Successfully processed: {recipe_data['title']}")
+            # Keep the parsed data in memory so an image-only pass later in
+            # this run doesn't re-read and re-parse Recipe.txt
+            self._recipe_cache[os.path.basename(image_path)] = recipe_data
             self.mark_image_processed(image_path, recipe_data['title'], success=True)
-            self.processed_count += 1
+            with self._state_lock:
+                self.recipe_index[content_id] = product_dir
+                self.save_recipe_index()
+            self._record_processed()
             return True
             
         except Exception as e:
             logger.error(f"❌ Failed to process {os.path.basename(image_path)}: {e}")
             self.mark_image_processed(image_path, f"Failed - {str(e)}", success=False)
-            self.failed_count += 1
+            self._record_failed()
             return False
     
     def process_all_images(self, start_index=0, batch_size=None, limit=None, generate_images=False, force_reprocess=False):
@@ -1418,9 +2428,18 @@ Suggested Price: $4.99
         if batch_size is None:
             batch_size = BATCH_SIZE
         
-        image_files = sorted([f for f in os.listdir(IMAGE_DIR) 
-                            if f.lower().endswith(('.jpg', '.jpeg', '.png'))])
-        
+        image_files = self.list_recipe_images()
+
+        # Drop already-processed images up front via the persisted set so
+        # they never occupy a batch slot (process_single_recipe keeps its
+        # own check as a safety net for direct calls)
+        if not force_reprocess:
+            remaining = [f for f in image_files if f not in self._processed_set]
+            skipped = len(image_files) - len(remaining)
+            if skipped:
+                logger.info(f"⏭️  Skipping {skipped} already processed images")
+            image_files = remaining
+
         total_images = len(image_files)
         logger.info(f"📷 Found {total_images} images to process")
         
@@ -1434,23 +2453,30 @@ Suggested Price: $4.99
             batch = image_files[i:i + batch_size]
             logger.info(f"🔄 Processing batch {i//batch_size + 1}: images {i+1}-{min(i+batch_size, total_images)}")
             
-            for img_file in batch:
-                img_path = os.path.join(IMAGE_DIR, img_file)
-                result = self.process_single_recipe(img_path, generate_images, force_reprocess)
-                
-                # Check for API error signal
-                if result is None:
-                    logger.error("🛑 Stopping batch processing due to API error")
-                    return
-                
-                time.sleep(2)  # Rate limiting
-            
+            # Each recipe is dominated by API round-trips, so run the batch
+            # concurrently under a small cap instead of strictly serially
+            # with a fixed sleep between images
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_RECIPES,
+                                                    len(batch))) as pool:
+                futures = [
+                    pool.submit(self.process_single_recipe,
+                                os.path.join(IMAGE_DIR, img_file),
+                                generate_images, force_reprocess)
+                    for img_file in batch
+                ]
+                results = [future.result() for future in futures]
+
+            # Check for API error signal
+            if any(result is None for result in results):
+                logger.error("🛑 Stopping batch processing due to API error")
+                return
+
             logger.info(f"⏸️  Batch complete. Processed: {self.processed_count}, Failed: {self.failed_count}")
-            
+
+            # Pause between batches only when throttling feedback demands it
             if i + batch_size < total_images:
-                logger.info("⏳ Waiting 30 seconds before next batch...")
-                time.sleep(30)
-        
+                self.rate_limiter.cooldown_if_needed()
+
         logger.info(f"🎉 Processing complete! Processed: {self.processed_count}, Failed: {self.failed_count}")
     
     def generate_images_for_processed_recipes(self, batch_size=None, limit=None):
@@ -1458,16 +2484,13 @@ Suggested Price: $4.99
         if batch_size is None:
             batch_size = BATCH_SIZE
         
-        image_files = sorted([f for f in os.listdir(IMAGE_DIR) 
-                            if f.lower().endswith(('.jpg', '.jpeg', '.png'))])
-        
-        # Filter for images that have been processed but don't have images generated
-        images_needing_images = []
-        for img_file in image_files:
-            img_path = os.path.join(IMAGE_DIR, img_file)
-            if self.is_image_processed(img_path) and not self.has_images_generated(img_path):
-                images_needing_images.append(img_file)
-        
+        image_files = self.list_recipe_images()
+
+        # Filter for images that have been processed but don't have images
+        # generated, as one C-level set difference over the prefetched sets
+        images_needing_images = sorted(
+            (set(image_files) & self._processed_set) - self._with_images_set)
+
         total_images = len(images_needing_images)
         logger.info(f"📷 Found {total_images} processed recipes that need images generated")
         
@@ -1485,98 +2508,124 @@ Suggested Price: $4.99
             batch = images_needing_images[i:i + batch_size]
             logger.info(f"🖼️  Generating images for batch {i//batch_size + 1}: images {i+1}-{min(i+batch_size, total_images)}")
             
-            for img_file in batch:
-                img_path = os.path.join(IMAGE_DIR, img_file)
-                result = self.generate_images_for_single_recipe(img_path)
-                
-                # Check for API error signal
-                if result is None:
-                    logger.error("🛑 Stopping image generation due to API error")
-                    return
-                
-                time.sleep(2)  # Rate limiting
-            
+            # DALL-E latency dominates here too; generate concurrently
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_RECIPES,
+                                                    len(batch))) as pool:
+                futures = [
+                    pool.submit(self.generate_images_for_single_recipe,
+                                os.path.join(IMAGE_DIR, img_file))
+                    for img_file in batch
+                ]
+                results = [future.result() for future in futures]
+
+            # Check for API error signal
+            if any(result is None for result in results):
+                logger.error("🛑 Stopping image generation due to API error")
+                return
+
             logger.info(f"⏸️  Batch complete. Images generated: {self.processed_count}, Failed: {self.failed_count}")
-            
+
+            # Pause between batches only when throttling feedback demands it
             if i + batch_size < total_images:
-                logger.info("⏳ Waiting 30 seconds before next batch...")
-                time.sleep(30)
-        
+                self.rate_limiter.cooldown_if_needed()
+
         logger.info(f"🎉 Image generation complete! Generated: {self.processed_count}, Failed: {self.failed_count}")
     
+    def _get_original_to_product(self):
+        """Map each original image name to its product directory
+
+        Built once per run with scandir (two directory reads total) instead
+        of re-listing PRODUCTS_DIR and stat'ing a candidate file inside every
+        product folder for every recipe, which was O(recipes x products).
+        create_product_folder keeps the map current for new folders.
+        """
+        if self._original_to_product is None:
+            mapping = {}
+            try:
+                with os.scandir(PRODUCTS_DIR) as products:
+                    for product in products:
+                        if not product.is_dir(follow_symlinks=False):
+                            continue
+                        with os.scandir(product.path) as files:
+                            for entry in files:
+                                if entry.name.startswith('original-'):
+                                    mapping[entry.name[len('original-'):]] = product.path
+            except FileNotFoundError:
+                pass
+            self._original_to_product = mapping
+        return self._original_to_product
+
     def generate_images_for_single_recipe(self, image_path):
         """Generate images for a single recipe that has already been processed"""
         try:
             image_name = os.path.basename(image_path)
             logger.info(f"🖼️  Generating images for: {image_name}")
-            
+
             # Find the product directory for this recipe
-            product_dir = None
-            for dir_name in os.listdir(PRODUCTS_DIR):
-                dir_path = os.path.join(PRODUCTS_DIR, dir_name)
-                if os.path.isdir(dir_path):
-                    # Check if this directory contains the original image
-                    original_image = f"original-{image_name}"
-                    if os.path.exists(os.path.join(dir_path, original_image)):
-                        product_dir = dir_path
-                        break
-            
+            product_dir = self._get_original_to_product().get(image_name)
+
             if not product_dir:
-                logger.error(f"❌ Could not find product directory for {image_name}")
-                self.failed_count += 1
-                return False
-            
-            # Load recipe data from the saved files
-            recipe_file = os.path.join(product_dir, "Recipe.txt")
-            if not os.path.exists(recipe_file):
-                logger.error(f"❌ Recipe file not found for {image_name}")
-                self.failed_count += 1
-                return False
-            
-            # Parse recipe data from the saved file
-            with open(recipe_file, 'r') as f:
-                recipe_text = f.read()
-            
-            # Extract recipe title from the file
-            lines = recipe_text.split('\n')
-            title = "Vintage Recipe"
-            for line in lines:
-                if line.startswith('Title:'):
-                    title = line.replace('Title:', '').strip()
-                    break
-            
-            # Create recipe data structure
-            recipe_data = {
-                'title': title,
-                'ingredients': [],
-                'instructions': [],
-                'servings': 'Unknown',
-                'prep_time': 'Unknown',
-                'cook_time': 'Unknown'
-            }
-            
-            # Extract other details from the file
-            in_ingredients = False
-            in_instructions = False
-            for line in lines:
-                line = line.strip()
-                if line.startswith('Servings:'):
-                    recipe_data['servings'] = line.replace('Servings:', '').strip()
-                elif line.startswith('Prep Time:'):
-                    recipe_data['prep_time'] = line.replace('Prep Time:', '').strip()
-                elif line.startswith('Cook Time:'):
-                    recipe_data['cook_time'] = line.replace('Cook Time:', '').strip()
-                elif line == 'Ingredients:':
-                    in_ingredients = True
-                    in_instructions = False
-                elif line == 'Instructions:':
-                    in_ingredients = False
-                    in_instructions = True
-                elif in_ingredients and line.startswith('- '):
-                    recipe_data['ingredients'].append(line[2:])
-                elif in_instructions and line and line[0].isdigit() and '. ' in line:
-                    recipe_data['instructions'].append(line.split('. ', 1)[1])
-            
+                logger.error(f"❌ Could not find product directory for {image_name}")
+                self._record_failed()
+                return False
+
+            # Recipes processed earlier in this run are still in memory -
+            # skip the Recipe.txt round-trip entirely for them
+            recipe_data = self._recipe_cache.get(image_name)
+
+            if recipe_data is None:
+                # Prefer the canonical JSON sidecar: one json.loads, no
+                # line-by-line reconstruction
+                try:
+                    with open(os.path.join(product_dir, "recipe.json"), 'r', encoding='utf-8') as f:
+                        recipe_data = json.load(f)
+                except (FileNotFoundError, json.JSONDecodeError):
+                    recipe_data = None
+
+            if recipe_data is None:
+                # Legacy product folders only have Recipe.txt
+                recipe_file = os.path.join(product_dir, "Recipe.txt")
+                if not os.path.exists(recipe_file):
+                    logger.error(f"❌ Recipe file not found for {image_name}")
+                    self._record_failed()
+                    return False
+
+                # Parse recipe data from the saved file
+                with open(recipe_file, 'r') as f:
+                    recipe_text = f.read()
+
+                # Rebuild the recipe structure in one pass over the lines using
+                # the precompiled line patterns: header fields match directly,
+                # and the Ingredients:/Instructions: headings toggle which list
+                # bullet/numbered lines land in
+                recipe_data = {
+                    'title': 'Vintage Recipe',
+                    'ingredients': [],
+                    'instructions': [],
+                    'servings': 'Unknown',
+                    'prep_time': 'Unknown',
+                    'cook_time': 'Unknown'
+                }
+
+                section = None
+                for line in recipe_text.split('\n'):
+                    line = line.strip()
+                    field = _RECIPE_FIELD_RE.match(line)
+                    if field:
+                        recipe_data[_RECIPE_FIELD_KEYS[field.group(1)]] = field.group(2).strip()
+                    elif line == 'Ingredients:':
+                        section = 'ingredients'
+                    elif line == 'Instructions:':
+                        section = 'instructions'
+                    elif section == 'ingredients':
+                        item = _RECIPE_INGREDIENT_RE.match(line)
+                        if item:
+                            recipe_data['ingredients'].append(item.group(1))
+                    elif section == 'instructions':
+                        step = _RECIPE_INSTRUCTION_RE.match(line)
+                        if step:
+                            recipe_data['instructions'].append(step.group(1))
+
             # Generate slug for the recipe
             slug = self.slugify(recipe_data['title'])
             
@@ -1590,275 +2639,210 @@ Suggested Price: $4.99
             
             if success:
                 logger.info(f"✅ Images generated for {recipe_data['title']}")
-                self.processed_count += 1
+                self._recipe_cache.pop(image_name, None)  # Done with this recipe
+                self._record_processed()
                 return True
             else:
                 logger.error(f"❌ Failed to generate images for {recipe_data['title']}")
-                self.failed_count += 1
+                self._record_failed()
                 return False
-                
+
         except Exception as e:
             logger.error(f"❌ Failed to generate images for {os.path.basename(image_path)}: {e}")
-            self.failed_count += 1
+            self._record_failed()
             return False
     
     def create_master_csv(self):
-        """Create master CSV file for all processed recipes"""
-        csv_data = []
-        
-        for product_dir in os.listdir(PRODUCTS_DIR):
-            product_path = os.path.join(PRODUCTS_DIR, product_dir)
-            if os.path.isdir(product_path):
-                csv_file = os.path.join(product_path, "listing.csv")
-                if os.path.exists(csv_file):
-                    with open(csv_file, 'r', encoding='utf-8') as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            row['Product Folder'] = product_dir
-                            csv_data.append(row)
-        
-        if csv_data:
-            master_csv_path = os.path.join(PRODUCTS_DIR, "master_listing.csv")
-            with open(master_csv_path, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = ['Product Folder'] + list(csv_data[0].keys() - {'Product Folder'})
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for row in csv_data:
-                    writer.writerow(row)
-            
+        """Create master CSV file for all processed recipes
+
+        One scandir pass over PRODUCTS_DIR finds the product folders, a
+        small thread pool reads the listing.csv files in parallel (lots of
+        tiny file opens are latency-bound, especially on network storage),
+        and a single csv.writer streams the results into the master file.
+        Results are consumed in sorted folder order, so the master header
+        always comes from the first product with a listing - not from
+        whichever read happens to finish first.
+        """
+        def read_listing(product):
+            """Read one listing.csv, returning (name, header, rows)"""
+            try:
+                with open(os.path.join(product.path, "listing.csv"),
+                          'r', newline='', encoding='utf-8') as f:
+                    rows = list(csv.reader(f))
+            except FileNotFoundError:
+                return product.name, None, None
+            if not rows:
+                return product.name, None, None
+            return product.name, rows[0], rows[1:]
+
+        with os.scandir(PRODUCTS_DIR) as entries:
+            product_dirs = sorted((entry for entry in entries
+                                   if entry.is_dir(follow_symlinks=False)),
+                                  key=lambda entry: entry.name)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(read_listing, product_dirs))
+
+        master_csv_path = os.path.join(PRODUCTS_DIR, "master_listing.csv")
+        master_file = None
+        writer = None
+        master_header = None
+        try:
+            for name, header, rows in results:
+                if header is None:
+                    continue
+                if writer is None:
+                    master_header = header
+                    master_file = open(master_csv_path, 'w', newline='',
+                                       encoding='utf-8', buffering=1024*1024)
+                    writer = csv.writer(master_file)
+                    writer.writerow(['Product Folder'] + header)
+                elif header != master_header:
+                    # Positional rows only line up if the columns do
+                    logger.warning(f"⚠️  Skipping {name}: listing.csv columns differ from master header")
+                    continue
+                for row in rows:
+                    writer.writerow([name, *row])
+        finally:
+            if master_file is not None:
+                master_file.close()
+
+        if writer is not None:
             logger.info(f"📊 Master CSV created: {master_csv_path}")
 
+    def _build_fancy_pdf(self, recipe_data, nutrition, output_path, image_paths=None):
+        """Shared builder behind both fancy recipe-card variants
+
+        The two public methods used to be near-identical 180-line copies
+        that diverged only in the image flowables, and both built the story
+        and then opened a second canvas on the same path for the border -
+        which overwrote the built document entirely. The decoration now
+        runs as a page callback inside the single doc.build pass, so the
+        card is rendered once, with its content and border together.
+        """
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table
+
+        # Ensure ingredients and instructions are strings
+        ingredients, instructions = normalize_recipe(recipe_data)
+
+        # Create the PDF document
+        doc = SimpleDocTemplate(output_path, pagesize=letter,
+                              rightMargin=0.5*inch, leftMargin=0.5*inch,
+                              topMargin=0.5*inch, bottomMargin=0.5*inch)
+
+        # Shared styles, built once per run
+        fancy = _get_fancy_pdf_styles()
+        title_style = fancy['title']
+        subtitle_style = fancy['subtitle']
+        section_style = fancy['section']
+        ingredient_style = fancy['ingredient']
+        instruction_style = fancy['instruction']
+
+        story = []
+
+        # Add decorative header
+        story.append(Paragraph("✧ ✧ ✧", title_style))
+        story.append(Spacer(1, 10))
+
+        # Recipe title
+        story.append(Paragraph(recipe_data['title'], title_style))
+        story.append(Spacer(1, 15))
+
+        # Recipe details
+        details_text = f"Servings: {recipe_data.get('servings', 'Unknown')} | Prep Time: {recipe_data.get('prep_time', 'Unknown')} | Cook Time: {recipe_data.get('cook_time', 'Unknown')}"
+        story.append(Paragraph(details_text, subtitle_style))
+        story.append(Spacer(1, 20))
+
+        # Add main image if available
+        if image_paths and len(image_paths) > 0 and os.path.exists(image_paths[0]):
+            try:
+                main_image = Image(_load_image_reader(image_paths[0]), width=3*inch, height=2.5*inch)
+                main_image.hAlign = 'CENTER'
+                story.append(main_image)
+                story.append(Spacer(1, 15))
+            except Exception as e:
+                logger.warning(f"Could not add main image: {e}")
+
+        # Create two-column layout for ingredients and instructions
+        if ingredients and instructions:
+            # One Paragraph per column instead of one flowable per line
+            # keeps platypus to a single wrap pass per list
+            ingredients_story = [
+                Paragraph("Ingredients", section_style),
+                Paragraph("<br/>".join(f"• {ingredient}" for ingredient in ingredients), ingredient_style)
+            ]
+
+            instructions_story = [
+                Paragraph("Instructions", section_style),
+                Paragraph("<br/>".join(f"{i}. {instruction}" for i, instruction in enumerate(instructions, 1)), instruction_style)
+            ]
+
+            # Create table for two-column layout
+            col_widths = [2.5*inch, 2.5*inch]
+            table_data = [
+                [ingredients_story, instructions_story]
+            ]
+
+            recipe_table = Table(table_data, colWidths=col_widths)
+            recipe_table.setStyle(fancy['layout_table'])
+
+            story.append(recipe_table)
+            story.append(Spacer(1, 20))
+
+        # Add serving image if available
+        if image_paths and len(image_paths) > 1 and os.path.exists(image_paths[1]):
+            try:
+                serving_image = Image(_load_image_reader(image_paths[1]), width=2.5*inch, height=2*inch)
+                serving_image.hAlign = 'CENTER'
+                story.append(serving_image)
+                story.append(Spacer(1, 15))
+            except Exception as e:
+                logger.warning(f"Could not add serving image: {e}")
+
+        # Nutrition information in a styled box
+        if nutrition and nutrition.get('calories') != "Unknown":
+            story.append(Paragraph("Nutrition Information (per serving)", section_style))
+
+            # Create nutrition table
+            nutrition_data = [
+                ['Calories', nutrition.get('calories', 'Unknown')],
+                ['Fat', nutrition.get('fat', 'Unknown')],
+                ['Carbohydrates', nutrition.get('carbs', 'Unknown')],
+                ['Protein', nutrition.get('protein', 'Unknown')]
+            ]
+
+            if nutrition.get('fiber') != "Unknown":
+                nutrition_data.append(['Fiber', nutrition.get('fiber', 'Unknown')])
+            if nutrition.get('sugar') != "Unknown":
+                nutrition_data.append(['Sugar', nutrition.get('sugar', 'Unknown')])
+            if nutrition.get('sodium') != "Unknown":
+                nutrition_data.append(['Sodium', nutrition.get('sodium', 'Unknown')])
+
+            nutrition_table = Table(nutrition_data, colWidths=[1.5*inch, 1*inch])
+            nutrition_table.setStyle(fancy['nutrition_table'])
+
+            story.append(nutrition_table)
+            story.append(Spacer(1, 20))
+
+        # Add decorative footer
+        story.append(Paragraph("✧ ✧ ✧", title_style))
+        story.append(Spacer(1, 10))
+
+        # Footer note
+        story.append(Paragraph("Digital Recipe Card - Perfect for printing and sharing", fancy['footer']))
+
+        # Build the PDF, drawing the border/decorations on each page as it
+        # renders instead of in a second pass over the finished file
+        doc.build(story, onFirstPage=_draw_fancy_page_decorations,
+                  onLaterPages=_draw_fancy_page_decorations)
+
     def create_fancy_recipe_pdf(self, recipe_data, nutrition, output_path, image_paths=None):
         """Create a professional, fancy recipe PDF with decorative elements and styling"""
         try:
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.lib.units import inch
-            from reportlab.pdfgen import canvas
-            from reportlab.lib import colors
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-            import math
-            
-            # Ensure ingredients and instructions are strings
-            def stringify(item):
-                if isinstance(item, dict):
-                    if 'ingredient' in item and 'quantity' in item:
-                        return f"{item['quantity']} {item['ingredient']}"
-                    elif 'ingredient' in item:
-                        return item['ingredient']
-                    elif 'quantity' in item:
-                        return item['quantity']
-                    else:
-                        return next(iter(item.values()), str(item))
-                return str(item)
-
-            ingredients = [stringify(ing) for ing in recipe_data.get('ingredients', [])]
-            instructions = [stringify(inst) for inst in recipe_data.get('instructions', [])]
-            
-            # Create the PDF document
-            doc = SimpleDocTemplate(output_path, pagesize=letter, 
-                                  rightMargin=0.5*inch, leftMargin=0.5*inch,
-                                  topMargin=0.5*inch, bottomMargin=0.5*inch)
-            
-            # Define custom styles
-            styles = getSampleStyleSheet()
-            
-            # Title style with decorative elements
-            title_style = ParagraphStyle(
-                'FancyTitle',
-                parent=styles['Heading1'],
-                fontSize=28,
-                spaceAfter=20,
-                alignment=TA_CENTER,
-                textColor=colors.darkred,
-                fontName='Helvetica-Bold'
-            )
-            
-            # Subtitle style
-            subtitle_style = ParagraphStyle(
-                'FancySubtitle',
-                parent=styles['Normal'],
-                fontSize=14,
-                spaceAfter=15,
-                alignment=TA_CENTER,
-                textColor=colors.darkgreen,
-                fontName='Helvetica'
-            )
-            
-            # Section header style
-            section_style = ParagraphStyle(
-                'FancySection',
-                parent=styles['Heading2'],
-                fontSize=18,
-                spaceAfter=10,
-                spaceBefore=15,
-                textColor=colors.darkblue,
-                fontName='Helvetica-Bold'
-            )
-            
-            # Ingredient style
-            ingredient_style = ParagraphStyle(
-                'FancyIngredient',
-                parent=styles['Normal'],
-                fontSize=12,
-                spaceAfter=3,
-                leftIndent=20,
-                fontName='Helvetica'
-            )
-            
-            # Instruction style
-            instruction_style = ParagraphStyle(
-                'FancyInstruction',
-                parent=styles['Normal'],
-                fontSize=12,
-                spaceAfter=8,
-                leftIndent=20,
-                fontName='Helvetica'
-            )
-            
-            # Nutrition style
-            nutrition_style = ParagraphStyle(
-                'FancyNutrition',
-                parent=styles['Normal'],
-                fontSize=10,
-                spaceAfter=5,
-                fontName='Helvetica-Oblique'
-            )
-            
-            story = []
-            
-            # Add decorative header
-            story.append(Paragraph("✧ ✧ ✧", title_style))
-            story.append(Spacer(1, 10))
-            
-            # Recipe title
-            story.append(Paragraph(recipe_data['title'], title_style))
-            story.append(Spacer(1, 15))
-            
-            # Recipe details in a decorative box
-            details_text = f"Servings: {recipe_data.get('servings', 'Unknown')} | Prep Time: {recipe_data.get('prep_time', 'Unknown')} | Cook Time: {recipe_data.get('cook_time', 'Unknown')}"
-            story.append(Paragraph(details_text, subtitle_style))
-            story.append(Spacer(1, 20))
-            
-            # Create two-column layout for ingredients and instructions
-            if ingredients and instructions:
-                # Ingredients column
-                ingredients_story = []
-                ingredients_story.append(Paragraph("Ingredients", section_style))
-                for ingredient in ingredients:
-                    ingredients_story.append(Paragraph(f"• {ingredient}", ingredient_style))
-                
-                # Instructions column
-                instructions_story = []
-                instructions_story.append(Paragraph("Instructions", section_style))
-                for i, instruction in enumerate(instructions, 1):
-                    instructions_story.append(Paragraph(f"{i}. {instruction}", instruction_style))
-                
-                # Create table for two-column layout
-                col_widths = [2.5*inch, 2.5*inch]
-                table_data = [
-                    [ingredients_story, instructions_story]
-                ]
-                
-                recipe_table = Table(table_data, colWidths=col_widths)
-                recipe_table.setStyle(TableStyle([
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-                    ('TOPPADDING', (0, 0), (-1, -1), 5),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-                ]))
-                
-                story.append(recipe_table)
-                story.append(Spacer(1, 20))
-            
-            # Nutrition information in a styled box
-            if nutrition and nutrition.get('calories') != "Unknown":
-                story.append(Paragraph("Nutrition Information (per serving)", section_style))
-                
-                # Create nutrition table
-                nutrition_data = [
-                    ['Calories', nutrition.get('calories', 'Unknown')],
-                    ['Fat', nutrition.get('fat', 'Unknown')],
-                    ['Carbohydrates', nutrition.get('carbs', 'Unknown')],
-                    ['Protein', nutrition.get('protein', 'Unknown')]
-                ]
-                
-                if nutrition.get('fiber') != "Unknown":
-                    nutrition_data.append(['Fiber', nutrition.get('fiber', 'Unknown')])
-                if nutrition.get('sugar') != "Unknown":
-                    nutrition_data.append(['Sugar', nutrition.get('sugar', 'Unknown')])
-                if nutrition.get('sodium') != "Unknown":
-                    nutrition_data.append(['Sodium', nutrition.get('sodium', 'Unknown')])
-                
-                nutrition_table = Table(nutrition_data, colWidths=[1.5*inch, 1*inch])
-                nutrition_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 10),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
-                
-                story.append(nutrition_table)
-                story.append(Spacer(1, 20))
-            
-            # Add decorative footer
-            story.append(Paragraph("✧ ✧ ✧", title_style))
-            story.append(Spacer(1, 10))
-            
-            # Footer note
-            footer_style = ParagraphStyle(
-                'Footer',
-                parent=styles['Normal'],
-                fontSize=8,
-                alignment=TA_CENTER,
-                textColor=colors.grey,
-                fontName='Helvetica-Oblique'
-            )
-            story.append(Paragraph("Digital Recipe Card - Perfect for printing and sharing", footer_style))
-            
-            # Build the PDF
-            doc.build(story)
-            
-            # Add decorative elements using canvas
-            c = canvas.Canvas(output_path)
-            width, height = letter
-            
-            # Add decorative border
-            c.setStrokeColor(colors.darkred)
-            c.setLineWidth(3)
-            c.rect(0.25*inch, 0.25*inch, width-0.5*inch, height-0.5*inch)
-            
-            # Add corner decorations
-            corner_size = 0.5*inch
-            for x, y in [(0.25*inch, height-0.75*inch), (width-0.75*inch, height-0.75*inch),
-                         (0.25*inch, 0.25*inch), (width-0.75*inch, 0.25*inch)]:
-                c.setFillColor(colors.darkred)
-                c.circle(x, y, 0.1*inch, fill=1)
-            
-            # Add side decorations
-            c.setStrokeColor(colors.darkgreen)
-            c.setLineWidth(1)
-            for i in range(5):
-                y = 1*inch + i * 1.5*inch
-                c.line(0.3*inch, y, 0.5*inch, y)
-                c.line(width-0.5*inch, y, width-0.3*inch, y)
-            
-            c.save()
-            
+            self._build_fancy_pdf(recipe_data, nutrition, output_path)
             logger.info(f"🎨 Fancy PDF created: {output_path}")
-            
         except Exception as e:
             logger.error(f"Fancy PDF creation error: {e}")
             # Fallback to regular PDF if fancy creation fails
@@ -1867,251 +2851,14 @@ Suggested Price: $4.99
     def create_fancy_recipe_pdf_with_images(self, recipe_data, nutrition, output_path, image_paths=None):
         """Create a professional, fancy recipe PDF with integrated images"""
         try:
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.lib.units import inch
-            from reportlab.pdfgen import canvas
-            from reportlab.lib import colors
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-            import math
-            import os
-            
-            # Ensure ingredients and instructions are strings
-            def stringify(item):
-                if isinstance(item, dict):
-                    if 'ingredient' in item and 'quantity' in item:
-                        return f"{item['quantity']} {item['ingredient']}"
-                    elif 'ingredient' in item:
-                        return item['ingredient']
-                    elif 'quantity' in item:
-                        return item['quantity']
-                    else:
-                        return next(iter(item.values()), str(item))
-                return str(item)
-
-            ingredients = [stringify(ing) for ing in recipe_data.get('ingredients', [])]
-            instructions = [stringify(inst) for inst in recipe_data.get('instructions', [])]
-            
-            # Create the PDF document
-            doc = SimpleDocTemplate(output_path, pagesize=letter, 
-                                  rightMargin=0.5*inch, leftMargin=0.5*inch,
-                                  topMargin=0.5*inch, bottomMargin=0.5*inch)
-            
-            # Define custom styles
-            styles = getSampleStyleSheet()
-            
-            # Title style with decorative elements
-            title_style = ParagraphStyle(
-                'FancyTitle',
-                parent=styles['Heading1'],
-                fontSize=28,
-                spaceAfter=20,
-                alignment=TA_CENTER,
-                textColor=colors.darkred,
-                fontName='Helvetica-Bold'
-            )
-            
-            # Subtitle style
-            subtitle_style = ParagraphStyle(
-                'FancySubtitle',
-                parent=styles['Normal'],
-                fontSize=14,
-                spaceAfter=15,
-                alignment=TA_CENTER,
-                textColor=colors.darkgreen,
-                fontName='Helvetica'
-            )
-            
-            # Section header style
-            section_style = ParagraphStyle(
-                'FancySection',
-                parent=styles['Heading2'],
-                fontSize=18,
-                spaceAfter=10,
-                spaceBefore=15,
-                textColor=colors.darkblue,
-                fontName='Helvetica-Bold'
-            )
-            
-            # Ingredient style
-            ingredient_style = ParagraphStyle(
-                'FancyIngredient',
-                parent=styles['Normal'],
-                fontSize=12,
-                spaceAfter=3,
-                leftIndent=20,
-                fontName='Helvetica'
-            )
-            
-            # Instruction style
-            instruction_style = ParagraphStyle(
-                'FancyInstruction',
-                parent=styles['Normal'],
-                fontSize=12,
-                spaceAfter=8,
-                leftIndent=20,
-                fontName='Helvetica'
-            )
-            
-            story = []
-            
-            # Add decorative header
-            story.append(Paragraph("✧ ✧ ✧", title_style))
-            story.append(Spacer(1, 10))
-            
-            # Recipe title
-            story.append(Paragraph(recipe_data['title'], title_style))
-            story.append(Spacer(1, 15))
-            
-            # Recipe details
-            details_text = f"Servings: {recipe_data.get('servings', 'Unknown')} | Prep Time: {recipe_data.get('prep_time', 'Unknown')} | Cook Time: {recipe_data.get('cook_time', 'Unknown')}"
-            story.append(Paragraph(details_text, subtitle_style))
-            story.append(Spacer(1, 20))
-            
-            # Add main image if available
-            if image_paths and len(image_paths) > 0 and os.path.exists(image_paths[0]):
-                try:
-                    main_image = Image(image_paths[0], width=3*inch, height=2.5*inch)
-                    main_image.hAlign = 'CENTER'
-                    story.append(main_image)
-                    story.append(Spacer(1, 15))
-                except Exception as e:
-                    logger.warning(f"Could not add main image: {e}")
-            
-            # Create two-column layout for ingredients and instructions
-            if ingredients and instructions:
-                # Ingredients column
-                ingredients_story = []
-                ingredients_story.append(Paragraph("Ingredients", section_style))
-                for ingredient in ingredients:
-                    ingredients_story.append(Paragraph(f"• {ingredient}", ingredient_style))
-                
-                # Instructions column
-                instructions_story = []
-                instructions_story.append(Paragraph("Instructions", section_style))
-                for i, instruction in enumerate(instructions, 1):
-                    instructions_story.append(Paragraph(f"{i}. {instruction}", instruction_style))
-                
-                # Create table for two-column layout
-                col_widths = [2.5*inch, 2.5*inch]
-                table_data = [
-                    [ingredients_story, instructions_story]
-                ]
-                
-                recipe_table = Table(table_data, colWidths=col_widths)
-                recipe_table.setStyle(TableStyle([
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-                    ('TOPPADDING', (0, 0), (-1, -1), 5),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-                ]))
-                
-                story.append(recipe_table)
-                story.append(Spacer(1, 20))
-            
-            # Add serving image if available
-            if image_paths and len(image_paths) > 1 and os.path.exists(image_paths[1]):
-                try:
-                    serving_image = Image(image_paths[1], width=2.5*inch, height=2*inch)
-                    serving_image.hAlign = 'CENTER'
-                    story.append(serving_image)
-                    story.append(Spacer(1, 15))
-                except Exception as e:
-                    logger.warning(f"Could not add serving image: {e}")
-            
-            # Nutrition information in a styled box
-            if nutrition and nutrition.get('calories') != "Unknown":
-                story.append(Paragraph("Nutrition Information (per serving)", section_style))
-                
-                # Create nutrition table
-                nutrition_data = [
-                    ['Calories', nutrition.get('calories', 'Unknown')],
-                    ['Fat', nutrition.get('fat', 'Unknown')],
-                    ['Carbohydrates', nutrition.get('carbs', 'Unknown')],
-                    ['Protein', nutrition.get('protein', 'Unknown')]
-                ]
-                
-                if nutrition.get('fiber') != "Unknown":
-                    nutrition_data.append(['Fiber', nutrition.get('fiber', 'Unknown')])
-                if nutrition.get('sugar') != "Unknown":
-                    nutrition_data.append(['Sugar', nutrition.get('sugar', 'Unknown')])
-                if nutrition.get('sodium') != "Unknown":
-                    nutrition_data.append(['Sodium', nutrition.get('sodium', 'Unknown')])
-                
-                nutrition_table = Table(nutrition_data, colWidths=[1.5*inch, 1*inch])
-                nutrition_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 10),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
-                
-                story.append(nutrition_table)
-                story.append(Spacer(1, 20))
-            
-            # Add decorative footer
-            story.append(Paragraph("✧ ✧ ✧", title_style))
-            story.append(Spacer(1, 10))
-            
-            # Footer note
-            footer_style = ParagraphStyle(
-                'Footer',
-                parent=styles['Normal'],
-                fontSize=8,
-                alignment=TA_CENTER,
-                textColor=colors.grey,
-                fontName='Helvetica-Oblique'
-            )
-            story.append(Paragraph("Digital Recipe Card - Perfect for printing and sharing", footer_style))
-            
-            # Build the PDF
-            doc.build(story)
-            
-            # Add decorative elements using canvas
-            c = canvas.Canvas(output_path)
-            width, height = letter
-            
-            # Add decorative border
-            c.setStrokeColor(colors.darkred)
-            c.setLineWidth(3)
-            c.rect(0.25*inch, 0.25*inch, width-0.5*inch, height-0.5*inch)
-            
-            # Add corner decorations
-            corner_size = 0.5*inch
-            for x, y in [(0.25*inch, height-0.75*inch), (width-0.75*inch, height-0.75*inch),
-                         (0.25*inch, 0.25*inch), (width-0.75*inch, 0.25*inch)]:
-                c.setFillColor(colors.darkred)
-                c.circle(x, y, 0.1*inch, fill=1)
-            
-            # Add side decorations
-            c.setStrokeColor(colors.darkgreen)
-            c.setLineWidth(1)
-            for i in range(5):
-                y = 1*inch + i * 1.5*inch
-                c.line(0.3*inch, y, 0.5*inch, y)
-                c.line(width-0.5*inch, y, width-0.3*inch, y)
-            
-            c.save()
-            
+            self._build_fancy_pdf(recipe_data, nutrition, output_path, image_paths)
             logger.info(f"🎨 Fancy PDF with images created: {output_path}")
-            
         except Exception as e:
             logger.error(f"Fancy PDF with images creation error: {e}")
             # Fallback to regular fancy PDF if image integration fails
             self.create_fancy_recipe_pdf(recipe_data, nutrition, output_path)
 
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -2127,6 +2874,7 @@ Examples:
   python recipe_automation_v2.py --all --force-reprocess    # Reprocess already processed images
   python recipe_automation_v2.py --images-only              # Generate images for processed recipes only
   python recipe_automation_v2.py --csv-only                 # Create master CSV only
+  python recipe_automation_v2.py --batch-enrich             # Refresh all descriptions via the Batch API
         """
     )
     
@@ -2148,17 +2896,27 @@ Examples:
         help='Create master CSV file only'
     )
     action_group.add_argument(
-        '--images-only', 
+        '--images-only',
         action='store_true',
         help='Generate images only for recipes that have been processed but don\'t have images yet'
     )
+    action_group.add_argument(
+        '--batch-enrich',
+        action='store_true',
+        help='Regenerate all product descriptions in one half-price Batch API job (turnaround can be hours)'
+    )
     
     # Options for single processing
     parser.add_argument(
-        '--image', 
+        '--image',
         type=str,
         help='Image filename or number (1-based) for single processing'
     )
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Never prompt; pick the first image when --single is run without --image'
+    )
     
     # Batch processing options
     parser.add_argument(
@@ -2207,6 +2965,11 @@ Examples:
         action='store_true',
         help='Force reprocessing of already processed images'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk GPT response cache'
+    )
     
     return parser.parse_args()
 
@@ -2225,35 +2988,44 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Log command execution
-    mst = pytz.timezone('US/Mountain')
-    timestamp = datetime.now(mst).strftime("%Y-%m-%d %H:%M:%S %Z")
-    
+    from zoneinfo import ZoneInfo
+    now = datetime.now(ZoneInfo('America/Denver'))
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S %Z")
+
     # Create logs directory if it doesn't exist
     os.makedirs("logs", exist_ok=True)
-    
+
     # Log the command that was executed
-    command_log_file = f"logs/command_execution_{datetime.now(mst).strftime('%Y%m%d_%H%M%S')}.log"
-    with open(command_log_file, 'w') as f:
-        f.write(f"Command Execution Log\n")
-        f.write(f"=" * 50 + "\n")
-        f.write(f"Timestamp: {timestamp}\n")
-        f.write(f"Command: python recipe_automation_v2.py {' '.join(sys.argv[1:])}\n")
-        f.write(f"Arguments: {vars(args)}\n")
-        f.write(f"=" * 50 + "\n\n")
-    
-    processor = RecipeProcessor(ocr_method=args.ocr_method)
+    command_log_file = f"logs/command_execution_{now.strftime('%Y%m%d_%H%M%S')}.log"
+    with open(command_log_file, 'w', buffering=128*1024) as f:
+        f.write(
+            f"Command Execution Log\n"
+            + "=" * 50 + "\n"
+            f"Timestamp: {timestamp}\n"
+            f"Command: python recipe_automation_v2.py {' '.join(sys.argv[1:])}\n"
+            f"Arguments: {vars(args)}\n"
+            + "=" * 50 + "\n\n")
+    
+    processor = RecipeProcessor(ocr_method=args.ocr_method, use_cache=not args.no_cache)
     
     print("🍳 Recipe Automation System v2.0")
     print("=" * 50)
-    
+
+    # Batch enrichment works from Products/, not the image directory
+    if args.batch_enrich:
+        print("📦 Refreshing product descriptions via the Batch API...")
+        initialize_clients()
+        updated = processor.batch_enrich_descriptions()
+        print(f"\n🎉 Batch enrichment complete! Updated {updated} products")
+        return
+
     # Check if images exist
     if not os.path.exists(IMAGE_DIR):
         print(f"❌ Image directory not found: {IMAGE_DIR}")
         return
     
-    image_files = [f for f in os.listdir(IMAGE_DIR) 
-                  if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
-    
+    image_files = processor.list_recipe_images()
+
     if not image_files:
         print(f"❌ No images found in {IMAGE_DIR}")
         return
@@ -2284,6 +3056,12 @@ def main():
                     print(f"❌ Image not found: {args.image}")
                     return
                 print(f"Processing: {args.image}")
+        elif args.yes or not sys.stdin.isatty():
+            # No image specified and nobody to answer a prompt (scripted
+            # run or explicit --yes); default to the first image instead
+            # of blocking forever on input()
+            img_path = os.path.join(IMAGE_DIR, image_files[0])
+            print(f"No --image given; defaulting to: {image_files[0]}")
         else:
             # No image specified, show available options
             print("\nAvailable images:")
@@ -2291,9 +3069,9 @@ def main():
                 print(f"{i}. {img_file}")
             if len(image_files) > 10:
                 print(f"... and {len(image_files) - 10} more")
-            
+
             img_choice = input(f"\nEnter image number (1-{min(10, len(image_files))}) or filename: ").strip()
-            
+
             try:
                 img_index = int(img_choice) - 1
                 if 0 <= img_index < len(image_files):
@@ -6,9 +6,12 @@ Helps install dependencies and configure the system
 
 import os
 import sys
+import shutil
 import subprocess
 import platform
+import functools
 
+@functools.lru_cache(maxsize=1)
 def check_python_version():
     """Check if Python version is compatible"""
     if sys.version_info < (3, 8):
@@ -28,21 +31,21 @@ def install_python_dependencies():
         print("❌ Failed to install Python dependencies")
         return False
 
+@functools.lru_cache(maxsize=1)
 def check_tesseract():
-    """Check if Tesseract OCR is installed"""
+    """Check if Tesseract OCR is installed
+
+    A PATH lookup instead of spawning `tesseract --version`, cached since
+    main() checks twice. install_tesseract() clears the cache after a
+    successful install.
+    """
     print("🔍 Checking Tesseract OCR...")
-    try:
-        result = subprocess.run(["tesseract", "--version"], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Tesseract OCR found")
-            return True
-        else:
-            print("❌ Tesseract OCR not found")
-            return False
-    except FileNotFoundError:
-        print("❌ Tesseract OCR not found")
-        return False
+    path = shutil.which("tesseract")
+    if path:
+        print(f"✅ Tesseract OCR found at {path}")
+        return True
+    print("❌ Tesseract OCR not found")
+    return False
 
 def install_tesseract():
     """Install Tesseract OCR based on platform"""
@@ -54,6 +57,7 @@ def install_tesseract():
         try:
             subprocess.check_call(["brew", "install", "tesseract"])
             print("✅ Tesseract OCR installed via Homebrew")
+            check_tesseract.cache_clear()
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             print("❌ Homebrew not found. Please install Homebrew first:")
@@ -65,6 +69,7 @@ def install_tesseract():
             subprocess.check_call(["sudo", "apt-get", "update"])
             subprocess.check_call(["sudo", "apt-get", "install", "-y", "tesseract-ocr"])
             print("✅ Tesseract OCR installed via apt")
+            check_tesseract.cache_clear()
             return True
         except subprocess.CalledProcessError:
             print("❌ Failed to install Tesseract OCR")
@@ -80,6 +85,7 @@ def install_tesseract():
         print(f"❌ Unsupported platform: {system}")
         return False
 
+@functools.lru_cache(maxsize=1)
 def check_api_keys():
     """Check if API key environment variables exist"""
     from dotenv import load_dotenv
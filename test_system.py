@@ -8,23 +8,53 @@ import os
 import sys
 from recipe_automation_v2 import RecipeProcessor
 
+# All tests share one processor: client setup and state loading happen
+# once instead of once per test
+_processor = None
+
+def get_processor():
+    """Return the shared RecipeProcessor, creating it on first use"""
+    global _processor
+    if _processor is None:
+        _processor = RecipeProcessor()
+    return _processor
+
 def test_ocr():
     """Test OCR functionality"""
     print("🔍 Testing OCR...")
-    processor = RecipeProcessor()
-    
+    processor = get_processor()
+
     # Find first image
-    image_files = [f for f in os.listdir("./Original-Images/") 
-                  if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
-    
+    with os.scandir("./Original-Images/") as it:
+        image_files = [e.name for e in it if e.is_file()
+                       and e.name.lower().endswith(('.jpg', '.jpeg', '.png'))]
+
     if not image_files:
         print("❌ No images found for testing")
         return False
-    
-    test_image = os.path.join("./Original-Images/", image_files[0])
-    print(f"📷 Testing with: {image_files[0]}")
-    
-    ocr_text = processor.extract_text_from_image(test_image)
+
+    if len(image_files) == 1:
+        test_image = os.path.join("./Original-Images/", image_files[0])
+        print(f"📷 Testing with: {image_files[0]}")
+        ocr_text = processor.extract_text_from_image(test_image)
+    else:
+        # Tesseract accepts a .txt file listing image paths and processes
+        # them all in one run, so startup cost is paid once per batch
+        # instead of once per image
+        import tempfile
+        import pytesseract
+
+        image_paths = [os.path.join("./Original-Images/", f) for f in image_files]
+        print(f"📷 Batch testing {len(image_paths)} images in one Tesseract run")
+
+        list_file = tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False)
+        try:
+            list_file.write('\n'.join(image_paths))
+            list_file.close()
+            ocr_text = pytesseract.image_to_string(list_file.name, config='--psm 6')
+        finally:
+            os.unlink(list_file.name)
+
     if ocr_text.strip():
         print("✅ OCR working")
         print(f"📝 Sample text: {ocr_text[:200]}...")
@@ -36,7 +66,7 @@ def test_ocr():
 def test_api_connection():
     """Test OpenAI API connection"""
     print("🔌 Testing API connection...")
-    processor = RecipeProcessor()
+    processor = get_processor()
     
     test_prompt = "Say 'Hello World' if you can read this."
     response = processor.ask_gpt(test_prompt)
@@ -51,7 +81,7 @@ def test_api_connection():
 def test_recipe_parsing():
     """Test recipe parsing with sample text"""
     print("📋 Testing recipe parsing...")
-    processor = RecipeProcessor()
+    processor = get_processor()
     
     sample_recipe = """
     Chocolate Chip Cookies
@@ -82,7 +112,7 @@ def test_recipe_parsing():
 def test_content_generation():
     """Test content generation"""
     print("✍️ Testing content generation...")
-    processor = RecipeProcessor()
+    processor = get_processor()
     
     sample_recipe = {
         "title": "Chocolate Chip Cookies",
@@ -101,16 +131,17 @@ def test_content_generation():
 def test_single_recipe():
     """Test processing a single recipe"""
     print("🧪 Testing single recipe processing...")
-    processor = RecipeProcessor()
+    processor = get_processor()
     
     # Find first image
-    image_files = [f for f in os.listdir("./Original-Images/") 
-                  if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
-    
+    with os.scandir("./Original-Images/") as it:
+        image_files = [e.name for e in it if e.is_file()
+                       and e.name.lower().endswith(('.jpg', '.jpeg', '.png'))]
+
     if not image_files:
         print("❌ No images found for testing")
         return False
-    
+
     test_image = os.path.join("./Original-Images/", image_files[0])
     print(f"📷 Processing: {image_files[0]}")
     
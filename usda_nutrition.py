@@ -1,46 +1,163 @@
 import requests
 import json
 import re
+
+# orjson parses the multi-KB USDA payloads several times faster than
+# stdlib json; fall back silently when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import hashlib
 import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import os
 from typing import Dict, List, Optional, Tuple
 
+# Timezone for log timestamps, resolved once at import
+MST = ZoneInfo('America/Denver')
+
+
+def _json_loads(data):
+    """Parse JSON bytes or text with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# On-disk cache of USDA responses; the database changes slowly, so repeat
+# ingredients across recipes ("flour", "sugar", "eggs") skip the network
+USDA_CACHE_DIR = "cache/usda"
+
+# Precompiled patterns for parse_ingredient — it runs once per ingredient
+# per recipe, so the regexes are built a single time here instead of on
+# every call
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_MODIFIER_RE = re.compile(
+    r'\b(fresh|dried|frozen|organic|large|small|medium|ripe|unripe)\b',
+    re.IGNORECASE)
+_UNIT_PATTERNS = [
+    ('cup', re.compile(r'\b(c\.?|cup|cups)\b', re.IGNORECASE)),
+    ('tablespoon', re.compile(r'\b(tbsp\.?|tablespoon|tablespoons)\b', re.IGNORECASE)),
+    ('teaspoon', re.compile(r'\b(tsp\.?|teaspoon|teaspoons)\b', re.IGNORECASE)),
+    ('ounce', re.compile(r'\b(oz\.?|ounce|ounces)\b', re.IGNORECASE)),
+    ('pound', re.compile(r'\b(lb\.?|pound|pounds)\b', re.IGNORECASE)),
+    ('gram', re.compile(r'\b(g\.?|gram|grams)\b', re.IGNORECASE)),
+    ('pint', re.compile(r'\b(pint|pints)\b', re.IGNORECASE)),
+    ('quart', re.compile(r'\b(qt\.?|quart|quarts)\b', re.IGNORECASE)),
+    ('gallon', re.compile(r'\b(gal\.?|gallon|gallons)\b', re.IGNORECASE)),
+]
+# The prefix/suffix junk is stripped with one fused alternation per end
+# (the trailing + consumes stacked prefixes like ". chopped " in the same
+# match) instead of eleven separate re.sub passes over the same string
+_PREFIX_RE = re.compile(
+    r'^(?:\.\s*|at least\s+|about\s+|approximately\s+|to taste\s+'
+    r'|for decoration\s*|chopped\s+|diced\s+|minced\s+|sliced\s+|grated\s+)+',
+    re.IGNORECASE)
+_SUFFIX_RE = re.compile(
+    r'(?:\.|,\s*(?:chopped|diced|minced|sliced|grated)|\s+for decoration)+$',
+    re.IGNORECASE)
+_FRACTION_RE = re.compile(r'^(\d+/\d+)')
+_NUMBER_RE = re.compile(r'^(\d+(?:\.\d+)?)')
+
+# Approximate grams per unit; anything unrecognized (counts like
+# "2 eggs", pints/quarts as before) falls back to 50 g per item
+_UNIT_TO_GRAMS = {
+    'cup': 240, 'cups': 240,
+    'tbsp': 15, 'tablespoon': 15, 'tablespoons': 15,
+    'tsp': 5, 'teaspoon': 5, 'teaspoons': 5,
+    'oz': 28.35, 'ounce': 28.35, 'ounces': 28.35,
+    'lb': 453.59, 'pound': 453.59, 'pounds': 453.59,
+    'g': 1, 'gram': 1, 'grams': 1,
+}
+
+# Cleanup leftovers that aren't real foods; no point spending a USDA
+# round trip (and rate-limit budget) searching for them
+_NONFOOD_NAMES = frozenset({
+    '', 'salt to taste', 'pepper to taste', 'to taste',
+    'garnish', 'for garnish', 'optional', 'as needed',
+})
+
+# Nutrient ID mapping with flexible matching
+_NUTRIENT_MAPPING = {
+    'calories': ['208', 'ENERC_KCAL', 'calories', 'energy'],
+    'protein': ['203', 'PROCNT', 'protein'],
+    'fat': ['204', 'FAT', 'total fat', 'fat'],
+    'carbs': ['205', 'CHOCDF', 'carbohydrate', 'carbs'],
+    'fiber': ['291', 'FIBTG', 'fiber', 'dietary fiber'],
+    'sugar': ['269', 'SUGAR', 'sugar', 'total sugars'],
+    'sodium': ['307', 'NA', 'sodium'],
+    'calcium': ['301', 'CA', 'calcium'],
+    'iron': ['303', 'FE', 'iron'],
+    'vitamin_c': ['401', 'VITC', 'vitamin c', 'ascorbic acid'],
+    'vitamin_a': ['320', 'VITA_RAE', 'vitamin a'],
+}
+
+# Reverse index so an entry's nutrient ID resolves in one dict hit
+# instead of an equality test against every term list
+_TERM_TO_NUTRIENT = {term: name
+                     for name, terms in _NUTRIENT_MAPPING.items()
+                     for term in terms}
+
 class USDANutritionAnalyzer:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.nal.usda.gov/fdc/v1"
-        
+
+        # One session for all USDA calls: keep-alive reuses the TLS
+        # connection instead of paying a fresh handshake per request. The
+        # adapter's pool is sized past the thread-pool width so concurrent
+        # lookups never discard and reopen connections.
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4,
+                                                pool_maxsize=16)
+        self.session.mount('https://', adapter)
+
+        # Two-tier response cache: in-process dict for repeats within a
+        # run, JSON files under USDA_CACHE_DIR for repeats across runs
+        self._response_cache = {}
+
         # Set up logging
         self.setup_logging()
         
     def setup_logging(self):
-        """Set up comprehensive logging to file"""
+        """Set up comprehensive logging to file
+
+        Quiet (WARNING) by default so batch runs don't spend time and
+        disk formatting per-ingredient chatter; set USDA_VERBOSE=1 to get
+        the full INFO/DEBUG trace. The file handler rotates so a long
+        run can't grow a multi-GB log.
+        """
         # Create logs directory if it doesn't exist
         os.makedirs("logs", exist_ok=True)
-        
+
         # Create timestamp for log file
-        mst = pytz.timezone('US/Mountain')
-        timestamp = datetime.now(mst).strftime("%Y%m%d_%H%M%S")
-        
+        now = datetime.now(MST)
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+        verbose = os.getenv('USDA_VERBOSE', '0') == '1'
+        level = logging.DEBUG if verbose else logging.WARNING
+
         # Set up file handler
         log_filename = f"logs/usda_nutrition_{timestamp}.log"
-        file_handler = logging.FileHandler(log_filename, mode='w')
-        file_handler.setLevel(logging.INFO)
-        
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_filename, maxBytes=10 * 1024 * 1024, backupCount=3)
+        file_handler.setLevel(level)
+
         # Set up console handler
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        
+        console_handler.setLevel(level)
+
         # Create formatter
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
-        
+
         # Set up logger
         self.logger = logging.getLogger('USDANutrition')
-        self.logger.setLevel(logging.INFO)
+        self.logger.setLevel(level)
         self.logger.handlers.clear()  # Clear existing handlers
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
@@ -50,28 +167,32 @@ class USDANutritionAnalyzer:
         self.logger.info("USDA NUTRITION ANALYZER INITIALIZED")
         self.logger.info("=" * 80)
         self.logger.info(f"Log file: {log_filename}")
-        self.logger.info(f"Timestamp: {datetime.now(mst).strftime('%Y-%m-%d %H:%M:%S %Z')}")
+        self.logger.info(f"Timestamp: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
         self.logger.info("=" * 80)
         
     def log_api_call(self, method: str, url: str, params: Dict = None, headers: Dict = None, response=None):
         """Log detailed API call information"""
-        mst = pytz.timezone('US/Mountain')
-        timestamp = datetime.now(mst).strftime("%Y-%m-%d %H:%M:%S %Z")
-        
-        self.logger.info(f"\n{'='*60}")
-        self.logger.info(f"API CALL - {timestamp}")
-        self.logger.info(f"{'='*60}")
-        self.logger.info(f"Method: {method}")
-        self.logger.info(f"URL: {url}")
-        
+        # All of this is INFO-level detail; skip the json.dumps/strftime
+        # work entirely when the logger won't emit it
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        # No manual timestamp: the formatter's %(asctime)s already stamps
+        # every record
+        self.logger.info("\n%s", '=' * 60)
+        self.logger.info("API CALL")
+        self.logger.info('=' * 60)
+        self.logger.info("Method: %s", method)
+        self.logger.info("URL: %s", url)
+
         if params:
-            self.logger.info(f"Parameters: {json.dumps(params, indent=2)}")
-        
+            self.logger.info("Parameters: %s", json.dumps(params, indent=2))
+
         if headers:
-            self.logger.info(f"Headers: {json.dumps(headers, indent=2)}")
-        
+            self.logger.info("Headers: %s", json.dumps(headers, indent=2))
+
         if response:
-            self.logger.info(f"Status Code: {response.status_code}")
+            self.logger.info("Status Code: %s", response.status_code)
             
             # Log rate limit headers
             rate_limit_headers = {
@@ -79,25 +200,64 @@ class USDANutritionAnalyzer:
                 'X-RateLimit-Remaining': response.headers.get('X-RateLimit-Remaining', 'Not provided'),
                 'X-RateLimit-Reset': response.headers.get('X-RateLimit-Reset', 'Not provided')
             }
-            self.logger.info(f"Rate Limit Info: {json.dumps(rate_limit_headers, indent=2)}")
-            
+            self.logger.info("Rate Limit Info: %s", json.dumps(rate_limit_headers, indent=2))
+
             # Log response headers
-            self.logger.info(f"Response Headers: {dict(response.headers)}")
-            
-            # Log response body (truncated if too long)
+            self.logger.info("Response Headers: %s", dict(response.headers))
+
+            # Log response body (truncated if too long). The raw byte size
+            # decides up front, so large responses are never re-serialized
+            # just to be sliced
             try:
-                response_data = response.json()
-                if len(json.dumps(response_data)) > 1000:
-                    self.logger.info(f"Response Body (truncated): {json.dumps(response_data, indent=2)[:1000]}...")
+                if len(response.content) > 1200:
+                    self.logger.info("Response Body (truncated): %s...", response.content[:1000].decode('utf-8', 'replace'))
                 else:
-                    self.logger.info(f"Response Body: {json.dumps(response_data, indent=2)}")
+                    self.logger.info("Response Body: %s", json.dumps(_json_loads(response.content), indent=2))
             except:
-                self.logger.info(f"Response Text: {response.text[:500]}...")
-        
-        self.logger.info(f"{'='*60}\n")
+                self.logger.info("Response Text: %s...", response.text[:500])
+
+        self.logger.info("%s\n", '=' * 60)
     
+    def _cache_get(self, key: str):
+        """Look up a cached USDA response, memory tier first"""
+        if key in self._response_cache:
+            return self._response_cache[key]
+        cache_path = os.path.join(
+            USDA_CACHE_DIR, hashlib.blake2b(key.encode()).hexdigest()[:24] + ".json")
+        try:
+            with open(cache_path, 'rb') as f:
+                value = _json_loads(f.read())['value']
+            self._response_cache[key] = value
+            return value
+        except (FileNotFoundError, ValueError, KeyError):
+            # ValueError covers both stdlib and orjson decode errors
+            return None
+
+    def _cache_put(self, key: str, value):
+        """Store a successful USDA response in both cache tiers"""
+        self._response_cache[key] = value
+        cache_path = os.path.join(
+            USDA_CACHE_DIR, hashlib.blake2b(key.encode()).hexdigest()[:24] + ".json")
+        try:
+            os.makedirs(USDA_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            entry = {'key': key, 'value': value}
+            with open(tmp_path, 'wb') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(entry))
+                else:
+                    f.write(json.dumps(entry).encode('utf-8'))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"⚠️  Could not write USDA cache entry: {e}")
+
     def search_food(self, query: str) -> List[Dict]:
         """Search for foods in the USDA database"""
+        cached = self._cache_get(f"search:{query}")
+        if cached is not None:
+            self.logger.debug("💾 Cache hit for search: '%s'", query)
+            return cached
+
         url = f"{self.base_url}/foods/search"
         params = {
             'api_key': self.api_key,
@@ -106,16 +266,17 @@ class USDANutritionAnalyzer:
             'dataType': ['Foundation', 'SR Legacy']
         }
         
-        self.logger.info(f"🔍 Searching USDA database for: '{query}'")
+        self.logger.info("🔍 Searching USDA database for: '%s'", query)
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             self.log_api_call('GET', url, params, response=response)
-            
+
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 foods = data.get('foods', [])
-                self.logger.info(f"✅ Found {len(foods)} results for '{query}'")
+                self.logger.info("✅ Found %s results for '%s'", len(foods), query)
+                self._cache_put(f"search:{query}", foods)
                 return foods
             else:
                 self.logger.error(f"❌ Search failed for '{query}': {response.status_code}")
@@ -127,18 +288,24 @@ class USDANutritionAnalyzer:
     
     def get_food_details(self, fdc_id: int) -> Optional[Dict]:
         """Get detailed nutrition information for a specific food"""
+        cached = self._cache_get(f"food:{fdc_id}")
+        if cached is not None:
+            self.logger.debug("💾 Cache hit for FDC ID: %s", fdc_id)
+            return cached
+
         url = f"{self.base_url}/food/{fdc_id}"
         params = {'api_key': self.api_key}
         
-        self.logger.info(f"📊 Getting nutrition details for FDC ID: {fdc_id}")
+        self.logger.info("📊 Getting nutrition details for FDC ID: %s", fdc_id)
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             self.log_api_call('GET', url, params, response=response)
-            
+
             if response.status_code == 200:
-                data = response.json()
-                self.logger.info(f"✅ Retrieved nutrition data for FDC ID: {fdc_id}")
+                data = _json_loads(response.content)
+                self.logger.info("✅ Retrieved nutrition data for FDC ID: %s", fdc_id)
+                self._cache_put(f"food:{fdc_id}", data)
                 return data
             else:
                 self.logger.error(f"❌ Failed to get details for FDC ID {fdc_id}: {response.status_code}")
@@ -147,147 +314,140 @@ class USDANutritionAnalyzer:
         except Exception as e:
             self.logger.error(f"❌ Exception getting details for FDC ID {fdc_id}: {e}")
             return None
-    
+
+    def get_foods_bulk(self, fdc_ids: List[int]) -> Dict[int, Optional[Dict]]:
+        """Get nutrition details for many FDC IDs in as few requests as possible
+
+        Cached IDs are answered locally; the misses go to the bulk /foods
+        endpoint, which returns up to 20 foods per call, so a recipe's
+        worth of detail lookups costs one or two round trips instead of
+        one per ingredient. IDs the API doesn't return map to None.
+        """
+        details = {}
+        misses = []
+        for fdc_id in fdc_ids:
+            cached = self._cache_get(f"food:{fdc_id}")
+            if cached is not None:
+                self.logger.debug("💾 Cache hit for FDC ID: %s", fdc_id)
+                details[fdc_id] = cached
+            else:
+                misses.append(fdc_id)
+
+        url = f"{self.base_url}/foods"
+        for start in range(0, len(misses), 20):
+            chunk = misses[start:start + 20]
+            params = {
+                'api_key': self.api_key,
+                'fdcIds': ','.join(str(fdc_id) for fdc_id in chunk)
+            }
+
+            self.logger.info("📊 Bulk fetching nutrition details for %s FDC IDs", len(chunk))
+
+            try:
+                response = self.session.get(url, params=params)
+                self.log_api_call('GET', url, params, response=response)
+
+                if response.status_code == 200:
+                    for food in _json_loads(response.content):
+                        food_id = food.get('fdcId')
+                        if food_id is not None:
+                            self._cache_put(f"food:{food_id}", food)
+                            details[food_id] = food
+                else:
+                    self.logger.error(f"❌ Bulk details fetch failed ({response.status_code}); falling back to single lookups")
+                    for fdc_id in chunk:
+                        details[fdc_id] = self.get_food_details(fdc_id)
+
+            except Exception as e:
+                self.logger.error(f"❌ Exception during bulk details fetch: {e}")
+
+            for fdc_id in chunk:
+                details.setdefault(fdc_id, None)
+
+        return details
+
     def parse_ingredient(self, ingredient: str) -> Tuple[str, str, str]:
         """Parse ingredient into quantity, unit, and food name"""
         # Remove common modifiers and parentheses
-        ingredient = re.sub(r'\([^)]*\)', '', ingredient)  # Remove parentheses content
-        ingredient = re.sub(r'\b(fresh|dried|frozen|organic|large|small|medium|ripe|unripe)\b', '', ingredient, flags=re.IGNORECASE)
+        ingredient = _PAREN_RE.sub('', ingredient)
+        ingredient = _MODIFIER_RE.sub('', ingredient)
         ingredient = ingredient.strip()
-        
-        # Common units and their patterns
-        units = {
-            'cup': r'\b(c\.?|cup|cups)\b',
-            'tablespoon': r'\b(tbsp\.?|tablespoon|tablespoons)\b',
-            'teaspoon': r'\b(tsp\.?|teaspoon|teaspoons)\b',
-            'ounce': r'\b(oz\.?|ounce|ounces)\b',
-            'pound': r'\b(lb\.?|pound|pounds)\b',
-            'gram': r'\b(g\.?|gram|grams)\b',
-            'pint': r'\b(pint|pints)\b',
-            'quart': r'\b(qt\.?|quart|quarts)\b',
-            'gallon': r'\b(gal\.?|gallon|gallons)\b'
-        }
-        
-        # Remove common prefixes that aren't food names
-        prefixes_to_remove = [
-            r'^\.\s*',  # Remove leading period
-            r'^at least\s+',
-            r'^about\s+',
-            r'^approximately\s+',
-            r'^to taste\s+',
-            r'^for decoration\s*',
-            r'^chopped\s+',
-            r'^diced\s+',
-            r'^minced\s+',
-            r'^sliced\s+',
-            r'^grated\s+',
-        ]
-        
-        for prefix in prefixes_to_remove:
-            ingredient = re.sub(prefix, '', ingredient, flags=re.IGNORECASE)
-        
-        ingredient = ingredient.strip()
-        
-        # Also remove trailing periods and common suffixes
-        ingredient = re.sub(r'\.$', '', ingredient)  # Remove trailing period
-        ingredient = re.sub(r',\s*chopped$', '', ingredient, flags=re.IGNORECASE)
-        ingredient = re.sub(r',\s*diced$', '', ingredient, flags=re.IGNORECASE)
-        ingredient = re.sub(r',\s*minced$', '', ingredient, flags=re.IGNORECASE)
-        ingredient = re.sub(r',\s*sliced$', '', ingredient, flags=re.IGNORECASE)
-        ingredient = re.sub(r',\s*grated$', '', ingredient, flags=re.IGNORECASE)
-        ingredient = re.sub(r'\s+for decoration$', '', ingredient, flags=re.IGNORECASE)
-        
-        ingredient = ingredient.strip()
-        
-        # First, try to find fractions
-        fraction_pattern = r'^(\d+/\d+)'
-        fraction_match = re.match(fraction_pattern, ingredient)
-        if fraction_match:
-            quantity = fraction_match.group(1)
-            remaining = ingredient[len(quantity):].strip()
-            
-            # Look for unit in remaining text
-            unit = ""
-            food_name = remaining
-            for unit_name, unit_pattern in units.items():
-                unit_match = re.search(unit_pattern, remaining, re.IGNORECASE)
-                if unit_match:
-                    unit = unit_name
-                    food_name = remaining[:unit_match.start()] + remaining[unit_match.end():]
-                    break
-            
-            return quantity, unit, food_name.strip()
-        
-        # Then try decimal numbers
-        number_pattern = r'^(\d+(?:\.\d+)?)'
-        number_match = re.match(number_pattern, ingredient)
-        if number_match:
-            quantity = number_match.group(1)
+
+        # Strip non-food prefixes and suffixes, one scan per end
+        ingredient = _PREFIX_RE.sub('', ingredient).strip()
+        ingredient = _SUFFIX_RE.sub('', ingredient).strip()
+
+        # Try fractions first, then decimal numbers
+        quantity_match = _FRACTION_RE.match(ingredient) or _NUMBER_RE.match(ingredient)
+        if quantity_match:
+            quantity = quantity_match.group(1)
             remaining = ingredient[len(quantity):].strip()
-            
+
             # Look for unit in remaining text
             unit = ""
             food_name = remaining
-            for unit_name, unit_pattern in units.items():
-                unit_match = re.search(unit_pattern, remaining, re.IGNORECASE)
+            for unit_name, unit_re in _UNIT_PATTERNS:
+                unit_match = unit_re.search(remaining)
                 if unit_match:
                     unit = unit_name
                     food_name = remaining[:unit_match.start()] + remaining[unit_match.end():]
                     break
-            
+
             return quantity, unit, food_name.strip()
-        
+
         # If no quantity found, assume it's just a food name
         return "1", "", ingredient
     
     def extract_nutrients(self, food_data: Dict) -> Dict[str, float]:
-        """Extract nutrition information from food data"""
+        """Extract nutrition information from food data
+
+        One pass over foodNutrients (often 100+ entries) instead of one
+        scan per target nutrient: IDs resolve through the reverse index in
+        a single dict hit, the substring fallback only checks nutrients
+        not yet found, and matching stops once all eleven are filled.
+        First match per nutrient wins, same as the old per-nutrient scan.
+        """
         nutrients = {}
-        
+
         if 'foodNutrients' not in food_data:
             self.logger.warning(f"⚠️  No foodNutrients found in food data")
             return nutrients
-        
-        # Nutrient ID mapping with flexible matching
-        nutrient_mapping = {
-            'calories': ['208', 'ENERC_KCAL', 'calories', 'energy'],
-            'protein': ['203', 'PROCNT', 'protein'],
-            'fat': ['204', 'FAT', 'total fat', 'fat'],
-            'carbs': ['205', 'CHOCDF', 'carbohydrate', 'carbs'],
-            'fiber': ['291', 'FIBTG', 'fiber', 'dietary fiber'],
-            'sugar': ['269', 'SUGAR', 'sugar', 'total sugars'],
-            'sodium': ['307', 'NA', 'sodium'],
-            'calcium': ['301', 'CA', 'calcium'],
-            'iron': ['303', 'FE', 'iron'],
-            'vitamin_c': ['401', 'VITC', 'vitamin c', 'ascorbic acid'],
-            'vitamin_a': ['320', 'VITA_RAE', 'vitamin a'],
-        }
-        
-        for nutrient_name, search_terms in nutrient_mapping.items():
-            for nutrient in food_data['foodNutrients']:
-                # Handle both old and new nutrient data structures
-                nutrient_id = str(nutrient.get('nutrientId', nutrient.get('nutrient', {}).get('id', '')))
-                nutrient_name_lower = nutrient.get('nutrientName', nutrient.get('nutrient', {}).get('name', '')).lower()
-                
-                # Check if this nutrient matches any of our search terms
-                if (nutrient_id in search_terms or 
-                    any(term in nutrient_name_lower for term in search_terms)):
-                    
-                    value = nutrient.get('value', nutrient.get('amount', 0))
-                    unit = nutrient.get('unitName', nutrient.get('nutrient', {}).get('unitName', ''))
-                    
-                    self.logger.info(f"📊 Found {nutrient_name}: {value} {unit} (ID: {nutrient_id}, Name: {nutrient.get('nutrientName', nutrient.get('nutrient', {}).get('name', 'Unknown'))})")
-                    
-                    # Convert to standard units if needed
-                    if unit.lower() in ['mg', 'milligram'] and nutrient_name in ['sodium', 'calcium', 'iron']:
-                        value = value / 1000  # Convert mg to g
-                    elif unit.lower() in ['mcg', 'microgram'] and nutrient_name in ['vitamin_a']:
-                        value = value / 1000  # Convert mcg to mg
-                    
-                    nutrients[nutrient_name] = value
-                    break
-        
-        self.logger.info(f"📊 Extracted {len(nutrients)} nutrients: {nutrients}")
+
+        remaining = dict(_NUTRIENT_MAPPING)
+
+        for nutrient in food_data['foodNutrients']:
+            if not remaining:
+                break
+
+            # Handle both old and new nutrient data structures
+            legacy = nutrient.get('nutrient', {})
+            nutrient_id = str(nutrient.get('nutrientId', legacy.get('id', '')))
+            display_name = nutrient.get('nutrientName', legacy.get('name', ''))
+            nutrient_name_lower = display_name.lower()
+            id_match = _TERM_TO_NUTRIENT.get(nutrient_id)
+
+            for nutrient_name in list(remaining):
+                if nutrient_name != id_match and not any(
+                        term in nutrient_name_lower for term in remaining[nutrient_name]):
+                    continue
+
+                value = nutrient.get('value', nutrient.get('amount', 0))
+                unit = nutrient.get('unitName', legacy.get('unitName', ''))
+
+                self.logger.debug("📊 Found %s: %s %s (ID: %s, Name: %s)",
+                                  nutrient_name, value, unit, nutrient_id,
+                                  display_name or 'Unknown')
+
+                # Convert to standard units if needed
+                if unit.lower() in ['mg', 'milligram'] and nutrient_name in ['sodium', 'calcium', 'iron']:
+                    value = value / 1000  # Convert mg to g
+                elif unit.lower() in ['mcg', 'microgram'] and nutrient_name in ['vitamin_a']:
+                    value = value / 1000  # Convert mcg to mg
+
+                nutrients[nutrient_name] = value
+                del remaining[nutrient_name]
+
+        self.logger.debug("📊 Extracted %s nutrients: %s", len(nutrients), nutrients)
         return nutrients
     
     def analyze_recipe_nutrition(self, ingredients: List[str], servings: int = 8) -> Dict:
@@ -303,39 +463,59 @@ class USDANutritionAnalyzer:
         }
         
         ingredient_results = []
-        
+
+        # Parse everything first (pure string work, fast)
+        parsed = []
         for ingredient in ingredients:
-            self.logger.info(f"\n🔍 Processing ingredient: {ingredient}")
-            
-            # Parse ingredient
+            self.logger.debug("\n🔍 Processing ingredient: %s", ingredient)
             quantity, unit, food_name = self.parse_ingredient(ingredient)
-            self.logger.info(f"📝 Parsed: quantity={quantity}, unit='{unit}', food='{food_name}'")
-            
+            self.logger.debug("📝 Parsed: quantity=%s, unit='%s', food='%s'",
+                              quantity, unit, food_name)
+
             if not food_name:
                 self.logger.warning(f"⚠️  Could not parse food name from: {ingredient}")
                 continue
-            
-            # Search for the food
-            search_results = self.search_food(food_name)
-            
+            if len(food_name) < 3 or food_name.lower() in _NONFOOD_NAMES:
+                self.logger.debug("⏭️  Skipping non-food entry: %s", ingredient)
+                continue
+            parsed.append((ingredient, quantity, unit, food_name))
+
+        # The two HTTP round trips per ingredient are pure network latency,
+        # so fan the searches out over a thread pool instead of paying
+        # them serially. Deduplicate first so "1 cup sugar" and "2 tbsp
+        # sugar" share one search; firing duplicates concurrently would
+        # race past the response cache
+        unique_foods = list(dict.fromkeys(food_name for _, _, _, food_name in parsed))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            search_by_food = dict(zip(unique_foods, pool.map(self.search_food, unique_foods)))
+
+        lookups = []
+        for ingredient, quantity, unit, food_name in parsed:
+            search_results = search_by_food[food_name]
             if not search_results:
                 self.logger.warning(f"⚠️  No results found for: {food_name}")
                 continue
-            
+
             # Get the best match (usually the first result)
             best_match = search_results[0]
             fdc_id = best_match.get('fdcId')
             description = best_match.get('description', 'Unknown')
-            
-            self.logger.info(f"✅ Best match: {description} (FDC ID: {fdc_id})")
-            
-            # Get detailed nutrition
-            food_details = self.get_food_details(fdc_id)
-            
+
+            self.logger.debug("✅ Best match: %s (FDC ID: %s)", description, fdc_id)
+            lookups.append((ingredient, quantity, unit, food_name, fdc_id, description))
+
+        # Detail lookups go through the bulk /foods endpoint: deduplicated
+        # IDs collapse into one round trip per 20 instead of one each
+        unique_ids = list(dict.fromkeys(fdc_id for _, _, _, _, fdc_id, _ in lookups))
+        details_by_id = self.get_foods_bulk(unique_ids)
+
+        # Aggregate serially so total_nutrients updates stay single-threaded
+        for ingredient, quantity, unit, food_name, fdc_id, description in lookups:
+            food_details = details_by_id[fdc_id]
             if not food_details:
                 self.logger.warning(f"⚠️  Could not get nutrition details for: {food_name}")
                 continue
-            
+
             # Extract nutrients
             nutrients = self.extract_nutrients(food_details)
             
@@ -343,36 +523,21 @@ class USDANutritionAnalyzer:
                 self.logger.warning(f"⚠️  No nutrients extracted for: {food_name}")
                 continue
             
-            # Calculate quantity multiplier
+            # Calculate quantity multiplier via one dict lookup
             try:
                 qty_multiplier = float(quantity) if quantity else 1.0
-                if unit.lower() in ['cup', 'cups']:
-                    qty_multiplier *= 240  # grams per cup (approximate)
-                elif unit.lower() in ['tbsp', 'tablespoon', 'tablespoons']:
-                    qty_multiplier *= 15  # grams per tablespoon
-                elif unit.lower() in ['tsp', 'teaspoon', 'teaspoons']:
-                    qty_multiplier *= 5  # grams per teaspoon
-                elif unit.lower() in ['oz', 'ounce', 'ounces']:
-                    qty_multiplier *= 28.35  # grams per ounce
-                elif unit.lower() in ['lb', 'pound', 'pounds']:
-                    qty_multiplier *= 453.59  # grams per pound
-                elif unit.lower() in ['g', 'gram', 'grams']:
-                    qty_multiplier *= 1  # already in grams
-                else:
-                    # Assume it's a count (like "2 eggs")
-                    qty_multiplier *= 50  # approximate grams per item
-                
-                self.logger.info(f"📊 Quantity multiplier: {qty_multiplier}")
-                
+                qty_multiplier *= _UNIT_TO_GRAMS.get(unit.lower(), 50)
+                self.logger.debug("📊 Quantity multiplier: %s", qty_multiplier)
             except ValueError:
                 self.logger.warning(f"⚠️  Could not parse quantity '{quantity}', using 1.0")
                 qty_multiplier = 1.0
             
-            # Scale nutrients by quantity
-            scaled_nutrients = {}
-            for nutrient, value in nutrients.items():
-                scaled_value = value * qty_multiplier / 100  # USDA data is per 100g
-                scaled_nutrients[nutrient] = scaled_value
+            # Scale nutrients by quantity (USDA data is per 100g), with the
+            # scale factor computed once per ingredient
+            scale = qty_multiplier / 100
+            scaled_nutrients = {nutrient: value * scale
+                                for nutrient, value in nutrients.items()}
+            for nutrient, scaled_value in scaled_nutrients.items():
                 total_nutrients[nutrient] += scaled_value
             
             ingredient_results.append({
@@ -385,12 +550,11 @@ class USDANutritionAnalyzer:
                 'nutrients': scaled_nutrients
             })
             
-            self.logger.info(f"📊 Scaled nutrients for {food_name}: {scaled_nutrients}")
+            self.logger.debug("📊 Scaled nutrients for %s: %s", food_name, scaled_nutrients)
         
         # Calculate per-serving values
-        per_serving = {}
-        for nutrient, total in total_nutrients.items():
-            per_serving[nutrient] = total / servings
+        per_serving = {nutrient: total / servings
+                       for nutrient, total in total_nutrients.items()}
         
         self.logger.info(f"\n📊 TOTAL NUTRITION (per serving):")
         for nutrient, value in per_serving.items():